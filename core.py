@@ -5,30 +5,246 @@ import git
 import tempfile
 import re
 import stat
+import heapq
+from itertools import islice
+from operator import itemgetter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
 
 # --- CONFIGURATION ---
 STD_LIBS = {
-    'python': {
+    'python': frozenset({
         'os', 'sys', 're', 'json', 'math', 'datetime', 'time', 'random',
         'subprocess', 'typing', 'collections', 'threading', 'asyncio',
         'logging', 'argparse', 'itertools', 'functools', 'pathlib', 'http',
         'email', 'enum', 'statistics', 'fractions'
-    },
-    'node': {
+    }),
+    'node': frozenset({
         'fs', 'path', 'http', 'https', 'os', 'util', 'events', 'crypto',
         'child_process', 'cluster', 'dns', 'net', 'stream', 'querystring',
         'url', 'zlib', 'timers'
-    },
-    'java': {'java.lang', 'java.util', 'java.io', 'java.net', 'java.math'},
-    'go': {'fmt', 'os', 'net', 'time', 'encoding', 'sync', 'strings',
-           'strconv', 'io', 'log', 'bufio', 'errors', 'context'}
+    }),
+    'java': frozenset({'java.lang', 'java.util', 'java.io', 'java.net', 'java.math'}),
+    'go': frozenset({'fmt', 'os', 'net', 'time', 'encoding', 'sync', 'strings',
+                     'strconv', 'io', 'log', 'bufio', 'errors', 'context'})
 }
+_PY_STD = STD_LIBS['python']
+_NODE_STD = STD_LIBS['node']
+
+# Dependencies that indicate a testing setup
+_PY_TEST_PKGS = frozenset({'pytest', 'unittest', 'nose', 'mock'})
+_NODE_TEST_PKGS = frozenset({'jest', 'mocha', 'chai', 'supertest'})
+# detected frameworks that are run through `npm test`
+_JS_TEST_FRAMEWORKS = frozenset({'jest', 'mocha'})
 
-IGNORE_DIRS = {
+IGNORE_DIRS = frozenset({
     '.git', 'node_modules', 'venv', '.env', '__pycache__',
     'dist', 'build', 'target', 'vendor', '.idea', '.vscode',
     'coverage', '.next', '__mocks__', 'assets', 'bin', 'obj', 'out', '.settings'
-}
+})
+
+# The scanner only reads the working tree at HEAD, so history is never needed
+SHALLOW_CLONE_OPTIONS = ['--depth=1', '--single-branch']
+PARTIAL_CLONE_OPTIONS = SHALLOW_CLONE_OPTIONS + ['--filter=blob:none']
+
+# Source files larger than this are almost always bundles or generated code
+MAX_ANALYZE_FILE_SIZE = 1_000_000
+# Imports, class declarations and routes cluster near the top of real sources
+ANALYZE_READ_LIMIT = 256 * 1024
+# Source files are read on a thread pool so the reads overlap
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Upper bound on files read ahead of the (ordered) analysis step
+MAX_PENDING_FILES = 512
+
+# Source extensions -> language bucket used for stats and analysis
+_EXT_LANG = {'.py': 'Python', '.js': 'Node.js', '.ts': 'Node.js',
+             '.java': 'Java', '.go': 'Go'}
+_CODE_EXTS = frozenset(_EXT_LANG)
+# Files shown in the rendered project structure
+_TREE_EXTS = ('.java', '.py', '.js', '.ts', '.go', '.json', '.xml', '.md', '.yml', '.yaml')
+# Rendered structure depth, plus one prebuilt indent string per level
+_TREE_MAX_DEPTH = 4
+_TREE_INDENTS = tuple('│   ' * i for i in range(_TREE_MAX_DEPTH))
+_TREE_BRANCH = '├── '
+
+# (language, tech_stack_details category, label, lowercase dependency names)
+# Spring is matched separately by substring since Java deps are full import paths.
+_STACK_RULES = (
+    # Frameworks
+    ("Python", "frameworks", "Django", frozenset({'django'})),
+    ("Python", "frameworks", "Flask", frozenset({'flask'})),
+    ("Python", "frameworks", "FastAPI", frozenset({'fastapi'})),
+    ("Node.js", "frameworks", "Express", frozenset({'express'})),
+    ("Node.js", "frameworks", "Next.js", frozenset({'next', 'next.js'})),
+    ("Node.js", "frameworks", "Nuxt.js", frozenset({'nuxt', 'nuxt.js'})),
+    ("Node.js", "frameworks", "NestJS", frozenset({'nest', 'nestjs'})),
+    ("Node.js", "frameworks", "Koa", frozenset({'koa'})),
+    ("Go", "frameworks", "Gin", frozenset({'gin'})),
+    ("Go", "frameworks", "Echo", frozenset({'echo'})),
+    # Databases
+    ("Python", "databases", "PostgreSQL", frozenset({'psycopg2', 'psycopg2-binary'})),
+    ("Python", "databases", "MySQL", frozenset({'mysqlclient', 'pymysql'})),
+    ("Python", "databases", "MongoDB", frozenset({'pymongo', 'motor'})),
+    ("Python", "databases", "SQL (SQLAlchemy)", frozenset({'sqlalchemy'})),
+    ("Node.js", "databases", "MongoDB", frozenset({'mongoose'})),
+    ("Node.js", "databases", "PostgreSQL", frozenset({'pg', 'pg-promise'})),
+    ("Node.js", "databases", "MySQL", frozenset({'mysql2'})),
+    ("Node.js", "databases", "Redis", frozenset({'redis', 'ioredis'})),
+    # Auth
+    ("Node.js", "auth", "JWT", frozenset({'jsonwebtoken'})),
+    ("Python", "auth", "JWT", frozenset({'jwt'})),
+    ("Node.js", "auth", "Passport.js", frozenset({'passport'})),
+    ("Python", "auth", "Django Allauth", frozenset({'django-allauth'})),
+    ("Python", "auth", "DRF + JWT", frozenset({'djangorestframework-simplejwt'})),
+    # Cache
+    ("Node.js", "cache", "Redis", frozenset({'redis', 'ioredis'})),
+    ("Python", "cache", "Redis", frozenset({'redis'})),
+)
+
+# --- PATTERNS (compiled once, reused for every scanned file) ---
+# Class declarations and imports are fused into one alternation per language so
+# each file is scanned once; callers dispatch on ``match.lastgroup``. The class
+# branch must not cross a newline, or a line ending in "class" would swallow the
+# next line's import as a class name.
+_PY_CODE_RE = re.compile(
+    r'\bclass[ \t]+(?P<cls>\w+)'
+    r'|^(?:from|import)\s+(?P<imp>[\w\.]+)',
+    re.MULTILINE
+)
+_JAVA_CODE_RE = re.compile(
+    r'\bclass[ \t]+(?P<cls>\w+)'
+    r'|import\s+(?P<imp>[\w\.]+);'
+)
+_JS_IMPORT_RE = re.compile(r'(?:require|from)\s*[\'"]([@\w./-]+)[\'"]')
+_GO_IMPORT_RE = re.compile(r'"([\w/\.]+)"')
+
+# process.env.VAR, os.environ["VAR"], os.environ.get("VAR"), os.getenv("VAR")
+# Single capture group so findall yields plain names; the lookaheads keep the
+# closing-quote requirement of the quoted forms.
+_ENV_VAR_RE = re.compile(
+    r'(?:process\.env\.'
+    r'|os\.environ\[\s*[\'"](?=[A-Z_][A-Z0-9_]*[\'"]\s*\])'
+    r'|os\.environ\.get\(\s*[\'"](?=[A-Z_][A-Z0-9_]*[\'"])'
+    r'|os\.getenv\(\s*[\'"](?=[A-Z_][A-Z0-9_]*[\'"]))'
+    r'([A-Z_][A-Z0-9_]*)'
+)
+
+# FastAPI: @app.get("/path")  |  Flask: @app.route("/path", methods=["GET","POST"])
+_PY_ROUTE_RE = re.compile(
+    r'(?i:@app\.(?P<method>get|post|put|delete|patch|options|head)\(\s*[\'"](?P<path>[^\'"]+)[\'"])'
+    r'|@app\.route\(\s*[\'"](?P<route>[^\'"]+)[\'"]\s*,\s*methods\s*=\s*\[(?P<methods>[^\]]+)\]'
+)
+_FLASK_METHOD_RE = re.compile(r'[\'"]([A-Z]+)[\'"]')
+# requirements.txt: leading distribution name of each line (drops specifiers,
+# extras, markers and trailing comments; skips comments and pip options)
+_REQ_RE = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9_.\-]*)', re.MULTILINE)
+_DJANGO_PATH_RE = re.compile(r'path\(\s*[\'"]([^\'"]+)[\'"]')
+# Express: app.get('/path', ...), router.post('/path', ...)
+_EXPRESS_ROUTE_RE = re.compile(
+    r'\b(?:app|router)\.(get|post|put|delete|patch|options|head)\(\s*[\'"]([^\'"]+)[\'"]',
+    re.IGNORECASE
+)
+
+# Static README fragments shared by every build_markdown() call
+_SCREENSHOT_BLOCK = (
+    "## 📸 Screenshot\n"
+    "![App Screenshot](https://via.placeholder.com/800x400?text=Application+Screenshot)\n\n"
+)
+_TOC_TITLE = "## 📑 Table of Contents\n"
+_TOC_CORE = (
+    "- [Architecture](#-architecture)\n"
+    "- [Project Structure](#-project-structure)\n"
+    "- [Installation](#-installation)\n"
+    "- [Usage](#-usage)\n"
+)
+_TOC_HEAD = _TOC_TITLE + _TOC_CORE
+_TOC_HEAD_TECH = _TOC_TITLE + "- [Tech Stack](#-tech-stack)\n" + _TOC_CORE
+_TOC_TAIL = (
+    "- [Project Health](#-project-health)\n"
+    "- [Contributing](#-contributing)\n"
+    "- [Next Steps](#-next-steps)\n"
+    "- [License](#-license)\n\n"
+)
+_CONTRIB_BLOCK = (
+    "## 🤝 Contributing\n"
+    "1. Fork the Project\n"
+    "2. Create your Feature Branch\n"
+    "3. Commit your Changes\n"
+    "4. Push to the Branch\n"
+    "5. Open a Pull Request\n\n"
+)
+_GH_BADGES = (
+    "[![Stars](https://img.shields.io/github/stars/{u}/{r}?style=social)]"
+    "(https://github.com/{u}/{r}/stargazers) "
+    "[![Forks](https://img.shields.io/github/forks/{u}/{r}?style=social)]"
+    "(https://github.com/{u}/{r}/network/members)\n"
+)
+_LANG_BADGE = "![{l}](https://img.shields.io/badge/Language-{l}-blue) "
+_NODE_SETUP = "2. **Node.js Setup**\n   ```bash\n   npm install\n   ```\n"
+_PYTHON_SETUP = "2. **Python Setup**\n   ```bash\n   python -m venv venv\n   source venv/bin/activate\n"
+_GO_SETUP = "2. **Go Setup**\n   ```bash\n   go mod tidy\n   ```\n"
+_MAVEN_SETUP = "2. **Java Setup**\n   ```bash\n   mvn clean install\n   ```\n"
+_GRADLE_SETUP = "2. **Java Setup**\n   ```bash\n   ./gradlew build\n   ```\n"
+_JAVAC_SETUP = "2. **Java Setup**\n   ```bash\n   # Raw Java Project: Compile manually\n   javac *.java\n   ```\n"
+
+# tech_stack_details categories that warrant a Tech Stack section
+_TECH_DETAIL_KEYS = frozenset(("frameworks", "databases", "auth", "cache"))
+
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _to_serializable(o):
+    """Recursively copy ``o`` into JSON-friendly types (sets -> sorted lists, tuples -> lists)."""
+    t = type(o)
+    if t in _ATOMIC_TYPES:
+        return o
+    if t is dict:
+        return {k: _to_serializable(v) for k, v in o.items()}
+    if t is list or t is tuple:
+        return [_to_serializable(x) for x in o]
+    if t is set or t is frozenset:
+        return [_to_serializable(x) for x in sorted(o)]
+    return str(o)
+
+
+def _read_source(entry):
+    """Read a source file for analysis, or None if unreadable / too large."""
+    try:
+        if entry.stat().st_size > MAX_ANALYZE_FILE_SIZE:
+            return None
+        with open(entry.path, 'r', errors='ignore', encoding='utf-8') as f:
+            return f.read(ANALYZE_READ_LIMIT)
+    except OSError:
+        return None
+
+
+_NEXT_STEP_SUGGESTIONS = (
+    "Add a proper LICENSE file (e.g., MIT, Apache 2.0).",
+    "Add automated tests (unit/integration) for critical parts.",
+    "Set up a CI pipeline (GitHub Actions, GitLab CI, etc.).",
+    "Document required environment variables in the README or `.env.example`.",
+    "Add or document dependency management files (`requirements.txt`, `package.json`, etc.).",
+)
+
+
+def _render_next_steps(mask):
+    """Render the Next Steps section for the suggestions selected by ``mask``."""
+    picked = [s for i, s in enumerate(_NEXT_STEP_SUGGESTIONS) if mask >> i & 1]
+    if not picked:
+        picked = ["Project looks good! Consider improving documentation and adding more examples."]
+    return ("## 🔮 Suggested Next Steps (Auto-generated)\n\n"
+            + "".join(f"- [ ] {s}\n" for s in picked) + "\n")
+
+
+# every combination is tiny, so render all of them once at import time
+_NEXT_STEPS_SECTIONS = tuple(
+    _render_next_steps(mask) for mask in range(1 << len(_NEXT_STEP_SUGGESTIONS))
+)
 
 
 class DeepScanner:
@@ -80,10 +296,10 @@ class DeepScanner:
 
             "api_endpoints": [],          # list of "METHOD /path"
             "license": "Unlicensed",
-            "modules": [],                # classes/modules
+            "modules": set(),             # classes/modules
             "env_vars": set(),
 
-            "tests": [],                  # detected test frameworks
+            "tests": set(),               # detected test frameworks
             "build_tools": set(),         # Maven, Gradle, Poetry, etc.
 
             # Paths to important files
@@ -120,7 +336,7 @@ class DeepScanner:
         if self.is_remote:
             self.temp_dir = tempfile.mkdtemp()
             try:
-                git.Repo.clone_from(self.original_path, self.temp_dir)
+                self._clone_remote()
                 self.path = self.temp_dir
                 self.metadata["repo_url"] = self.original_path
                 parts = self.original_path.rstrip('/').split('/')
@@ -146,6 +362,17 @@ class DeepScanner:
                 pass
         return self.path
 
+    def _clone_remote(self):
+        try:
+            git.Repo.clone_from(self.original_path, self.temp_dir,
+                                multi_options=PARTIAL_CLONE_OPTIONS)
+        except git.GitCommandError:
+            # older git / servers without partial-clone support: plain shallow clone
+            self.cleanup()
+            self.temp_dir = tempfile.mkdtemp()
+            git.Repo.clone_from(self.original_path, self.temp_dir,
+                                multi_options=SHALLOW_CLONE_OPTIONS)
+
     def cleanup(self):
         if self.temp_dir and os.path.exists(self.temp_dir):
             try:
@@ -168,21 +395,13 @@ class DeepScanner:
 
     def get_serializable_metadata(self):
         """Return metadata as JSON-serializable dict (sets -> lists)."""
-        m = self.metadata
-        out = json.loads(json.dumps(m, default=self._json_default))
-        return out
-
-    @staticmethod
-    def _json_default(obj):
-        if isinstance(obj, set):
-            return list(obj)
-        return str(obj)
+        return _to_serializable(self.metadata)
 
     # ---------- Description / license ----------
 
     def _generate_smart_description(self):
         name = self.metadata["project_name"].replace('-', ' ').replace('_', ' ').title()
-        langs = list(self.metadata["languages"])
+        langs = sorted(self.metadata["languages"])
 
         ptype = "Software Solution"
         if "Api" in name:
@@ -196,7 +415,7 @@ class DeepScanner:
 
         desc = f"**{name}** is a {ptype}"
         if langs:
-            desc += f" built with **{sorted(langs)[0]}**"
+            desc += f" built with **{langs[0]}**"
 
         # Use structured tech stack details if available
         details = self.metadata.get("tech_stack_details", {})
@@ -212,19 +431,23 @@ class DeepScanner:
         return desc
 
     def _scan_license(self):
-        for f in os.listdir(self.path):
-            if f.upper().startswith('LICENSE') or f.upper().startswith('COPYING'):
+        with os.scandir(self.path) as it:
+            for entry in it:
+                # both prefixes are 7 chars: uppercase only that slice of the name
+                if entry.name[:7].upper() not in ('LICENSE', 'COPYING'):
+                    continue
                 try:
-                    with open(os.path.join(self.path, f), 'r', encoding="utf-8", errors="ignore") as lic_file:
+                    # classify on raw bytes: no decode needed for ASCII keywords
+                    with open(entry.path, 'rb') as lic_file:
                         content = lic_file.read(200).upper()
-                        if "MIT" in content:
-                            self.metadata["license"] = "MIT"
-                        elif "APACHE" in content:
-                            self.metadata["license"] = "Apache 2.0"
-                        elif "GNU" in content or "GPL" in content:
-                            self.metadata["license"] = "GPL"
-                        else:
-                            self.metadata["license"] = "See LICENSE file"
+                    if b"MIT" in content:
+                        self.metadata["license"] = "MIT"
+                    elif b"APACHE" in content:
+                        self.metadata["license"] = "Apache 2.0"
+                    elif b"GNU" in content or b"GPL" in content:
+                        self.metadata["license"] = "GPL"
+                    else:
+                        self.metadata["license"] = "See LICENSE file"
                 except Exception:
                     pass
                 break
@@ -232,14 +455,58 @@ class DeepScanner:
     # ---------- Tree / file scanning ----------
 
     def _scan_tree(self, root_path):
+        # Source reads run on a thread pool; manifest parsing and code analysis
+        # are queued and applied on this thread in walk order, so "first match
+        # wins" fields (entry points, project name, ...) stay deterministic.
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            pending = deque()
+            self._walk_tree(root_path, pool, pending)
+            self._run_pending(pending, 0)
+
+    @staticmethod
+    def _run_pending(pending, keep):
+        while len(pending) > keep:
+            func, *args = pending.popleft()
+            func(*args)
+
+    def _walk_tree(self, root_path, pool, pending):
         tree_lines = []
         stats = self.metadata["stats"]
 
-        for root, dirs, files in os.walk(root_path):
-            # Filter out ignored dirs
-            dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
-
-            rel_path = os.path.relpath(root, root_path)
+        # Explicit depth-first walk over os.scandir: DirEntry caches the file type
+        # from the directory listing and already carries the joined path.
+        # (absolute dir, dir relative to root_path) so relpath is never recomputed
+        stack = [(root_path, '.')]
+        while stack:
+            root, rel_path = stack.pop()
+            try:
+                with os.scandir(root) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            dirs = []
+            files = []
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry)
+                    continue
+                # Filter out ignored dirs and hidden dirs (except .github, needed for CI detection)
+                d = entry.name
+                if d in IGNORE_DIRS or (d.startswith('.') and d != '.github'):
+                    continue
+                dirs.append(d)
+                if not entry.is_symlink():
+                    subdirs.append((entry.path, d if rel_path == '.' else rel_path + os.sep + d))
+            # reversed so directories are visited in listing order (top-down, like os.walk)
+            stack.extend(reversed(subdirs))
+
+            rel_dir = '' if rel_path == '.' else rel_path + os.sep
             level = 0 if rel_path == '.' else rel_path.count(os.sep) + 1
 
             # CI detection via directory structure
@@ -247,14 +514,13 @@ class DeepScanner:
                 stats["has_ci"] = True
 
             # Tree representation
-            if level < 4:
-                indent = '│   ' * level
-                subindent = '├── '
+            if level < _TREE_MAX_DEPTH:
+                indent = _TREE_INDENTS[level]
                 if level > 0:
-                    tree_lines.append(f"{indent}{subindent}{os.path.basename(root)}/")
-                for f in files:
-                    if f.endswith(('.java', '.py', '.js', '.ts', '.go', '.json', '.xml', '.md', '.yml', '.yaml')):
-                        tree_lines.append(f"{indent}│   {f}")
+                    tree_lines.append(f"{indent}{_TREE_BRANCH}{os.path.basename(root)}/")
+                for entry in files:
+                    if entry.name.endswith(_TREE_EXTS):
+                        tree_lines.append(f"{indent}│   {entry.name}")
 
             # Top-level service detection (monorepo-ish)
             if rel_path != '.':
@@ -270,9 +536,17 @@ class DeepScanner:
             else:
                 top_service = None
 
-            for f in files:
-                filepath = os.path.join(root, f)
-                ext = os.path.splitext(f)[1].lower()
+            # test-directory heuristics only depend on the directory
+            parts = root.split(os.sep)
+            in_py_tests = 'tests' in parts
+            in_js_tests = '__tests__' in parts
+
+            for entry in files:
+                f = entry.name
+                filepath = entry.path
+                # same result as os.path.splitext (leading dots are not an extension)
+                head, _, tail = f.rpartition('.')
+                ext = '.' + tail.lower() if head.strip('.') else ''
 
                 # CI configs by file name
                 if f in ('circle.yml', '.gitlab-ci.yml', 'azure-pipelines.yml',
@@ -297,19 +571,19 @@ class DeepScanner:
                 # Config & Build Tools
                 if f == 'package.json':
                     if self.metadata["node_package_json_path"] is None:
-                        self.metadata["node_package_json_path"] = os.path.relpath(filepath, self.path)
+                        self.metadata["node_package_json_path"] = rel_dir + f
                     self.metadata["languages"].add("Node.js")
                     if top_service:
                         self._service_info[top_service]["has_package_json"] = True
-                    self._parse_package_json(filepath)
+                    pending.append((self._parse_package_json, filepath))
 
                 elif f == 'requirements.txt':
                     if self.metadata["python_requirements_path"] is None:
-                        self.metadata["python_requirements_path"] = os.path.relpath(filepath, self.path)
+                        self.metadata["python_requirements_path"] = rel_dir + f
                     self.metadata["languages"].add("Python")
                     if top_service:
                         self._service_info[top_service]["has_requirements"] = True
-                    self._parse_requirements(filepath)
+                    pending.append((self._parse_requirements, filepath))
 
                 elif f == 'pom.xml':
                     self.metadata["languages"].add("Java")
@@ -324,33 +598,26 @@ class DeepScanner:
                 elif f == 'go.mod':
                     self.metadata["languages"].add("Go")
                     if self.metadata["go_mod_path"] is None:
-                        self.metadata["go_mod_path"] = os.path.relpath(filepath, self.path)
+                        self.metadata["go_mod_path"] = rel_dir + f
                     if top_service:
                         self._service_info[top_service]["has_go_mod"] = True
 
                 # Code Analysis
-                if ext in ['.py', '.js', '.ts', '.java', '.go']:
+                if ext in _CODE_EXTS:
                     # stats: file counts
-                    if ext == '.py':
-                        stats["files"]["Python"] += 1
-                    elif ext in ['.js', '.ts']:
-                        stats["files"]["Node.js"] += 1
-                    elif ext == '.java':
-                        stats["files"]["Java"] += 1
-                    elif ext == '.go':
-                        stats["files"]["Go"] += 1
+                    stats["files"][_EXT_LANG[ext]] += 1
 
                     # test file heuristics
                     if ext == '.py':
-                        if (f.startswith('test_') or f.endswith('_test.py') or
-                                'tests' in root.split(os.sep)):
+                        if in_py_tests or f.startswith('test_') or f.endswith('_test.py'):
                             stats["test_files"] += 1
-                    elif ext in ['.js', '.ts']:
-                        if (f.endswith(('.test.js', '.spec.js', '.test.ts', '.spec.ts')) or
-                                '__tests__' in root.split(os.sep)):
+                    elif ext in ('.js', '.ts'):
+                        if in_js_tests or f.endswith(('.test.js', '.spec.js', '.test.ts', '.spec.ts')):
                             stats["test_files"] += 1
 
-                    self._analyze_code(filepath, ext)
+                    pending.append((self._analyze_code, filepath, ext,
+                                    pool.submit(_read_source, entry)))
+                    self._run_pending(pending, MAX_PENDING_FILES)
 
         self.metadata["structure"] = "```text\n.\n" + "\n".join(tree_lines) + "\n```"
 
@@ -358,8 +625,9 @@ class DeepScanner:
 
     def _parse_package_json(self, filepath):
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 if data.get('name'):
                     self.metadata["project_name"] = data.get('name')
 
@@ -380,170 +648,148 @@ class DeepScanner:
 
                 # Detect Testing Frameworks
                 for d in deps + devDeps:
-                    if d in ['jest', 'mocha', 'chai', 'supertest']:
-                        self.metadata["tests"].append(d)
+                    if d in _NODE_TEST_PKGS:
+                        self.metadata["tests"].add(d)
         except Exception:
             pass
 
     def _parse_requirements(self, filepath):
         try:
             with open(filepath, encoding="utf-8") as f:
-                deps = [
-                    line.split('==')[0].strip()
-                    for line in f
-                    if line.strip() and not line.strip().startswith('#')
-                ]
-                self.metadata["dependencies"]["Python"].update(deps)
-                for d in deps:
-                    if d in ['pytest', 'unittest', 'nose', 'mock']:
-                        self.metadata["tests"].append(d)
+                deps = _REQ_RE.findall(f.read())
+            self.metadata["dependencies"]["Python"].update(deps)
+            self.metadata["tests"].update(_PY_TEST_PKGS.intersection(deps))
         except Exception:
             pass
 
     # ---------- Code analysis ----------
 
-    def _analyze_code(self, filepath, ext):
+    def _analyze_code(self, filepath, ext, source):
+        # source: future resolving to the file content (see _read_source)
+        handler = self._EXT_HANDLERS.get(ext)
+        if handler is None:
+            return
+        # Language comes from the extension alone, so oversized files still count
+        self.metadata["languages"].add(_EXT_LANG[ext])
         try:
-            with open(filepath, 'r', errors='ignore', encoding='utf-8') as f:
-                content = f.read()
-                fname = os.path.basename(filepath)
+            content = source.result()
+            if content is None:
+                return
 
-                # --- PYTHON ---
-                if ext == '.py':
-                    self.metadata["languages"].add("Python")
+            handler(self, content, os.path.basename(filepath))
 
-                    if ('if __name__ == "__main__":' in content or 'app.run(' in content):
-                        if not self.metadata["entry_points"]["Python"]:
-                            self.metadata["entry_points"]["Python"] = fname
-                        if not self.metadata["entry_point"]:
-                            self.metadata["entry_point"] = fname
+            # Env Vars (Universal)
+            self._detect_env_vars(content)
 
-                    classes = re.findall(r'class\s+(\w+)', content)
-                    for c in classes:
-                        self.metadata["modules"].append(c)
+            # API endpoints
+            self._detect_api_endpoints(content, ext, filepath)
 
-                    imports = re.findall(r'^(?:from|import)\s+([\w\.]+)', content, re.MULTILINE)
-                    for imp in imports:
-                        root_imp = imp.split('.')[0]
-                        if root_imp not in STD_LIBS['python']:
-                            self.metadata["dependencies"]["Python"].add(root_imp)
+        except Exception:
+            pass
 
-                # --- NODE.JS / TS ---
-                elif ext in ['.js', '.ts']:
-                    self.metadata["languages"].add("Node.js")
+    def _set_entry_point(self, lang, fname):
+        if not self.metadata["entry_points"][lang]:
+            self.metadata["entry_points"][lang] = fname
+        if not self.metadata["entry_point"]:
+            self.metadata["entry_point"] = fname
 
-                    if 'app.listen' in content or 'server.listen' in content:
-                        if not self.metadata["entry_points"]["Node.js"]:
-                            self.metadata["entry_points"]["Node.js"] = fname
-                        if not self.metadata["entry_point"]:
-                            self.metadata["entry_point"] = fname
+    def _analyze_python(self, content, fname):
+        if ('if __name__ == "__main__":' in content or 'app.run(' in content):
+            self._set_entry_point("Python", fname)
 
-                    imports = re.findall(r'(?:require|from)\s*[\'"]([@\w./-]+)[\'"]', content)
-                    for imp in imports:
-                        if not imp.startswith('.') and imp.split('/')[0] not in STD_LIBS['node']:
-                            self.metadata["dependencies"]["Node.js"].add(imp.split('/')[0])
+        imports = []
+        for match in _PY_CODE_RE.finditer(content):
+            if match.lastgroup == 'cls':
+                self.metadata["modules"].add(match.group('cls'))
+            else:
+                imports.append(match.group('imp'))
+        self.metadata["dependencies"]["Python"].update(
+            root for imp in imports
+            if (root := imp.split('.')[0]) not in _PY_STD
+        )
 
-                # --- GO ---
-                elif ext == '.go':
-                    self.metadata["languages"].add("Go")
+    def _analyze_node(self, content, fname):
+        if 'app.listen' in content or 'server.listen' in content:
+            self._set_entry_point("Node.js", fname)
 
-                    if 'func main()' in content:
-                        if not self.metadata["entry_points"]["Go"]:
-                            self.metadata["entry_points"]["Go"] = fname
-                        if not self.metadata["entry_point"]:
-                            self.metadata["entry_point"] = fname
+        if 'require' in content or 'from' in content:
+            self.metadata["dependencies"]["Node.js"].update(
+                root for imp in _JS_IMPORT_RE.findall(content)
+                if not imp.startswith('.') and (root := imp.split('/')[0]) not in _NODE_STD
+            )
 
-                    imports = re.findall(r'"([\w/\.]+)"', content)
-                    for imp in imports:
-                        # crude heuristic: external packages usually contain dots or slashes
-                        if '.' in imp or '/' in imp:
-                            self.metadata["dependencies"]["Go"].add(imp)
+    def _analyze_go(self, content, fname):
+        if 'func main()' in content:
+            self._set_entry_point("Go", fname)
 
-                # --- JAVA ---
-                elif ext == '.java':
-                    self.metadata["languages"].add("Java")
+        # crude heuristic: external packages usually contain dots or slashes
+        self.metadata["dependencies"]["Go"].update(
+            imp for imp in _GO_IMPORT_RE.findall(content)
+            if '.' in imp or '/' in imp
+        )
 
-                    class_match = re.search(r'class\s+(\w+)', content)
-                    if class_match:
-                        self.metadata["modules"].append(class_match.group(1))
+    def _analyze_java(self, content, fname):
+        main_class = None
+        imports = []
+        for match in _JAVA_CODE_RE.finditer(content):
+            if match.lastgroup == 'cls':
+                if main_class is None:
+                    main_class = match.group('cls')
+            else:
+                imports.append(match.group('imp'))
 
-                    if "public static void main" in content:
-                        if not self.metadata["entry_points"]["Java"]:
-                            self.metadata["entry_points"]["Java"] = fname
-                        if not self.metadata["entry_point"]:
-                            self.metadata["entry_point"] = fname
-                        if class_match:
-                            self.metadata["entry_point_cmd"] = class_match.group(1)
+        if main_class:
+            self.metadata["modules"].add(main_class)
 
-                    imports = re.findall(r'import\s+([\w\.]+);', content)
-                    for imp in imports:
-                        if not any(imp.startswith(std) for std in ['java.lang', 'java.util', 'java.io']):
-                            self.metadata["dependencies"]["Java"].add(imp)
+        if "public static void main" in content:
+            self._set_entry_point("Java", fname)
+            if main_class:
+                self.metadata["entry_point_cmd"] = main_class
 
-                # Env Vars (Universal)
-                self._detect_env_vars(content)
+        self.metadata["dependencies"]["Java"].update(
+            imp for imp in imports
+            if not imp.startswith(('java.lang', 'java.util', 'java.io'))
+        )
 
-                # API endpoints
-                self._detect_api_endpoints(content, ext, filepath)
-
-        except Exception:
-            pass
+    # extension -> per-language analyzer (plain functions, called with self)
+    _EXT_HANDLERS = {
+        '.py': _analyze_python,
+        '.js': _analyze_node,
+        '.ts': _analyze_node,
+        '.go': _analyze_go,
+        '.java': _analyze_java,
+    }
 
     def _detect_env_vars(self, content):
-        # process.env.VAR, os.environ["VAR"], os.environ.get("VAR"), os.getenv("VAR")
-        pattern = (
-            r'process\.env\.([A-Z_][A-Z0-9_]*)'
-            r'|os\.environ\[\s*[\'"]([A-Z_][A-Z0-9_]*)[\'"]\s*\]'
-            r'|os\.environ\.get\(\s*[\'"]([A-Z_][A-Z0-9_]*)[\'"]'
-            r'|os\.getenv\(\s*[\'"]([A-Z_][A-Z0-9_]*)[\'"]'
-        )
-        matches = re.findall(pattern, content)
-        for group in matches:
-            for name in group:
-                if name:
-                    self.metadata["env_vars"].add(name)
+        # every supported form contains "env", so skip the regex when it can't match
+        if 'env' not in content:
+            return
+        self.metadata["env_vars"].update(_ENV_VAR_RE.findall(content))
 
     def _detect_api_endpoints(self, content, ext, filepath):
         # Very heuristic, but good enough for auto-doc starting point
         endpoints = set()
 
         if ext == '.py':
-            # FastAPI style: @app.get("/path")
-            for method, path in re.findall(
-                r'@app\.(get|post|put|delete|patch|options|head)\(\s*[\'"]([^\'"]+)[\'"]',
-                content,
-                flags=re.IGNORECASE
-            ):
-                endpoints.add(f"{method.upper()} {path}")
-
-            # Flask: @app.route("/path", methods=["GET","POST"])
-            for path, methods in re.findall(
-                r'@app\.route\(\s*[\'"]([^\'"]+)[\'"]\s*,\s*methods\s*=\s*\[([^\]]+)\]',
-                content
-            ):
-                for m in re.findall(r'[\'"]([A-Z]+)[\'"]', methods):
-                    endpoints.add(f"{m.upper()} {path}")
+            # FastAPI / Flask decorators in a single pass
+            for match in _PY_ROUTE_RE.finditer(content):
+                if match.lastgroup == 'path':
+                    endpoints.add(f"{match.group('method').upper()} {match.group('path')}")
+                else:
+                    path = match.group('route')
+                    for m in _FLASK_METHOD_RE.findall(match.group('methods')):
+                        endpoints.add(f"{m.upper()} {path}")
 
             # Django urls.py: path("users/", ...)
             fname = os.path.basename(filepath)
-            if fname in ('urls.py', 'routes.py'):
-                for path in re.findall(r'path\(\s*[\'"]([^\'"]+)[\'"]', content):
+            if fname in ('urls.py', 'routes.py') and 'path(' in content:
+                for path in _DJANGO_PATH_RE.findall(content):
                     clean = "/" + path.strip('/ ')
                     endpoints.add(f"* {clean}")
 
         elif ext in ['.js', '.ts']:
             # Express: app.get('/path', ...), router.post('/path', ...)
-            for method, path in re.findall(
-                r'\bapp\.(get|post|put|delete|patch|options|head)\(\s*[\'"]([^\'"]+)[\'"]',
-                content,
-                flags=re.IGNORECASE
-            ):
-                endpoints.add(f"{method.upper()} {path}")
-            for method, path in re.findall(
-                r'\brouter\.(get|post|put|delete|patch|options|head)\(\s*[\'"]([^\'"]+)[\'"]',
-                content,
-                flags=re.IGNORECASE
-            ):
+            for method, path in _EXPRESS_ROUTE_RE.findall(content):
                 endpoints.add(f"{method.upper()} {path}")
 
         for ep in sorted(endpoints):
@@ -557,70 +803,18 @@ class DeepScanner:
         m = self.metadata
         details = m["tech_stack_details"]
 
-        py_deps = {d.lower() for d in m["dependencies"]["Python"]}
-        node_deps = {d.lower() for d in m["dependencies"]["Node.js"]}
-        java_deps = {d.lower() for d in m["dependencies"]["Java"]}
-        go_deps = {d.lower() for d in m["dependencies"]["Go"]}
-
-        # Frameworks
-        if 'django' in py_deps:
-            details["frameworks"].add("Django")
-        if 'flask' in py_deps:
-            details["frameworks"].add("Flask")
-        if 'fastapi' in py_deps:
-            details["frameworks"].add("FastAPI")
-
-        if 'express' in node_deps:
-            details["frameworks"].add("Express")
-        if 'next' in node_deps or 'next.js' in node_deps:
-            details["frameworks"].add("Next.js")
-        if 'nuxt' in node_deps or 'nuxt.js' in node_deps:
-            details["frameworks"].add("Nuxt.js")
-        if 'nest' in node_deps or 'nestjs' in node_deps:
-            details["frameworks"].add("NestJS")
-        if 'koa' in node_deps:
-            details["frameworks"].add("Koa")
-
-        if any('spring' in d for d in java_deps):
-            details["frameworks"].add("Spring/Spring Boot")
+        deps_by_lang = {
+            lang: {d.lower() for d in deps}
+            for lang, deps in m["dependencies"].items()
+        }
 
-        if 'gin' in go_deps:
-            details["frameworks"].add("Gin")
-        if 'echo' in go_deps:
-            details["frameworks"].add("Echo")
-
-        # Databases
-        if {'psycopg2', 'psycopg2-binary'} & py_deps:
-            details["databases"].add("PostgreSQL")
-        if 'mysqlclient' in py_deps or 'pymysql' in py_deps:
-            details["databases"].add("MySQL")
-        if 'pymongo' in py_deps or 'motor' in py_deps:
-            details["databases"].add("MongoDB")
-        if 'sqlalchemy' in py_deps:
-            details["databases"].add("SQL (SQLAlchemy)")
-
-        if 'mongoose' in node_deps:
-            details["databases"].add("MongoDB")
-        if 'pg' in node_deps or 'pg-promise' in node_deps:
-            details["databases"].add("PostgreSQL")
-        if 'mysql2' in node_deps:
-            details["databases"].add("MySQL")
-        if 'redis' in node_deps or 'ioredis' in node_deps:
-            details["databases"].add("Redis")
-
-        # Auth
-        if 'jsonwebtoken' in node_deps or 'jwt' in py_deps:
-            details["auth"].add("JWT")
-        if 'passport' in node_deps:
-            details["auth"].add("Passport.js")
-        if 'django-allauth' in py_deps:
-            details["auth"].add("Django Allauth")
-        if 'djangorestframework-simplejwt' in py_deps:
-            details["auth"].add("DRF + JWT")
-
-        # Cache
-        if 'redis' in node_deps or 'ioredis' in node_deps or 'redis' in py_deps:
-            details["cache"].add("Redis")
+        for lang, category, label, keys in _STACK_RULES:
+            if keys & deps_by_lang[lang]:
+                details[category].add(label)
+
+        java_deps = deps_by_lang["Java"]
+        if java_deps and any('spring' in d for d in java_deps):
+            details["frameworks"].add("Spring/Spring Boot")
 
         # Mirror into flat tech_stack labels
         for fw in details["frameworks"]:
@@ -665,7 +859,7 @@ class DeepScanner:
                 entry = entry.split('.')[0]
 
             chart += f"    {entry} --> Logic_Layer\n"
-            for mod in self.metadata["modules"][:6]:
+            for mod in heapq.nsmallest(6, self.metadata["modules"]):
                 if mod != entry:
                     chart += f"    Logic_Layer --> {mod}\n"
 
@@ -676,8 +870,8 @@ class DeepScanner:
             chart += f"    UI --> {backend}\n"
 
             # Map Frameworks/DBs
-            for dep in (self.metadata["dependencies"].get("Node.js", set()) |
-                        self.metadata["dependencies"].get("Python", set())):
+            deps = self.metadata["dependencies"]
+            for dep in deps.get("Node.js", set()) | deps.get("Python", set()):
                 if dep in ['mongoose', 'mongodb', 'pg', 'mysql', 'mysql2', 'sequelize']:
                     chart += f"    {backend} --> {dep}[({dep} DB)]\n"
                 elif dep in ['redis', 'ioredis']:
@@ -714,350 +908,301 @@ class DeepScanner:
 
     def build_markdown(self, template="Detailed"):
         m = self.metadata
-        langs = sorted(list(m["languages"]))
+        langs = sorted(m["languages"])
 
-        md = f"# {m['project_name']}\n\n"
+        parts = [f"# {m['project_name']}\n\n"]
+        append = parts.append
 
         if template == "Minimal":
             # language badges
-            for l in langs:
-                md += f"![{l}](https://img.shields.io/badge/Language-{l}-blue) "
-            md += "\n\n"
-            md += f"## 📝 Description\n{m['description']}\n\n"
+            append("".join(_LANG_BADGE.format(l=l) for l in langs))
+            append(f"\n\n## 📝 Description\n{m['description']}\n\n")
             if self.custom_context:
-                md += f"> **Context:** {self.custom_context}\n\n"
-            md += "## 🛠 Tech Stack\n"
+                append(f"> **Context:** {self.custom_context}\n\n")
             if self._has_tech_stack_details():
-                md += self._generate_tech_stack_list() + "\n"
+                append(f"## 🛠 Tech Stack\n{self._generate_tech_stack_list()}\n")
             else:
-                md += ", ".join(langs) + "\n\n"
-            md += "## ⚙️ Installation\n" + self._generate_strict_install(langs)
-            md += "## 🚀 Usage\n" + self._generate_strict_usage(langs)
+                append(f"## 🛠 Tech Stack\n{', '.join(langs)}\n\n")
+            append(f"## ⚙️ Installation\n{self._generate_strict_install(langs)}")
+            append(f"## 🚀 Usage\n{self._generate_strict_usage(langs)}")
             if m["env_vars"]:
-                md += self._generate_env_section()
+                self._append_env_section(append)
             if m["api_endpoints"]:
-                md += self._generate_api_section()
-            md += f"## 📄 License\n{m['license']}"
-            return md
+                self._append_api_section(append)
+            append(f"## 📄 License\n{m['license']}")
+            return "".join(parts)
 
         # Detailed
         if m['username'] != "username":
-            user, repo = m['username'], m['repo_name']
-            md += (
-                f"[![Stars](https://img.shields.io/github/stars/{user}/{repo}?style=social)]"
-                f"(https://github.com/{user}/{repo}/stargazers) "
-            )
-            md += (
-                f"[![Forks](https://img.shields.io/github/forks/{user}/{repo}?style=social)]"
-                f"(https://github.com/{user}/{repo}/network/members)\n"
-            )
+            append(_GH_BADGES.format(u=m['username'], r=m['repo_name']))
         else:
-            for l in langs:
-                md += f"![{l}](https://img.shields.io/badge/Language-{l}-blue) "
-        md += f"![License](https://img.shields.io/badge/License-{m['license'].replace(' ', '_')}-green)\n\n"
+            append("".join(_LANG_BADGE.format(l=l) for l in langs))
+        append(f"![License](https://img.shields.io/badge/License-{m['license'].replace(' ', '_')}-green)\n\n")
 
-        md += f"## 📝 Description\n{m['description']}\n\n"
+        append(f"## 📝 Description\n{m['description']}\n\n")
         if self.custom_context:
-            md += f"> **Developer Note:** {self.custom_context}\n\n"
+            append(f"> **Developer Note:** {self.custom_context}\n\n")
+
+        append(_SCREENSHOT_BLOCK)
 
-        md += "## 📸 Screenshot\n![App Screenshot](https://via.placeholder.com/800x400?text=Application+Screenshot)\n\n"
+        m_deps, m_docker, m_stats = m["dependencies"], m["docker"], m["stats"]
+        has_tech = self._has_tech_stack_details()
+        has_api = bool(m["api_endpoints"])
+        has_env = bool(m["env_vars"])
+        has_docker = bool(m_docker["dockerfile"] or m_docker["compose"])
+        has_services = bool(m["services"])
+        has_scripts = bool(m["scripts"])
+        has_deps = any(m_deps.values())
+        has_tests = bool(m["tests"]) or m_stats["test_files"] > 0
 
         # Table of contents
-        md += "## 📑 Table of Contents\n"
-        if self._has_tech_stack_details():
-            md += "- [Tech Stack](#-tech-stack)\n"
-        md += "- [Architecture](#-architecture)\n"
-        md += "- [Project Structure](#-project-structure)\n"
-        md += "- [Installation](#-installation)\n"
-        md += "- [Usage](#-usage)\n"
-        if m["api_endpoints"]:
-            md += "- [API Endpoints](#-api-endpoints)\n"
-        if m["env_vars"]:
-            md += "- [Environment Variables](#-environment-variables)\n"
-        if m["docker"]["dockerfile"] or m["docker"]["compose"]:
-            md += "- [Docker](#-docker)\n"
-        if m["services"]:
-            md += "- [Services](#-services)\n"
-        if m["scripts"]:
-            md += "- [Scripts](#-scripts)\n"
-        if any(m["dependencies"].values()):
-            md += "- [Dependencies](#-dependencies)\n"
-        if m["tests"] or m["stats"]["test_files"] > 0:
-            md += "- [Testing](#-testing)\n"
-        md += "- [Project Health](#-project-health)\n"
-        md += "- [Contributing](#-contributing)\n"
-        md += "- [Next Steps](#-next-steps)\n"
-        md += "- [License](#-license)\n\n"
+        toc_optional = (
+            ("- [API Endpoints](#-api-endpoints)\n", has_api),
+            ("- [Environment Variables](#-environment-variables)\n", has_env),
+            ("- [Docker](#-docker)\n", has_docker),
+            ("- [Services](#-services)\n", has_services),
+            ("- [Scripts](#-scripts)\n", has_scripts),
+            ("- [Dependencies](#-dependencies)\n", has_deps),
+            ("- [Testing](#-testing)\n", has_tests),
+        )
+        append(_TOC_HEAD_TECH if has_tech else _TOC_HEAD)
+        append("".join(item for item, cond in toc_optional if cond))
+        append(_TOC_TAIL)
 
         # Sections
-        if self._has_tech_stack_details():
-            md += "## 🛠 Tech Stack\n" + self._generate_tech_stack_list() + "\n"
-
-        md += "## 🏗 Architecture\n" + self.generate_diagrams() + "\n\n"
-        md += "## 📂 Project Structure\n" + m["structure"] + "\n\n"
-        md += "## ⚙️ Installation\n" + self._generate_strict_install(langs)
-        md += "## 🚀 Usage\n" + self._generate_strict_usage(langs)
-
-        if m["api_endpoints"]:
-            md += self._generate_api_section()
-        if m["env_vars"]:
-            md += self._generate_env_section()
-        if m["docker"]["dockerfile"] or m["docker"]["compose"]:
-            md += self._generate_docker_section()
-        if m["services"]:
-            md += self._generate_services_section()
+        if has_tech:
+            append(f"## 🛠 Tech Stack\n{self._generate_tech_stack_list()}\n")
+
+        append(f"## 🏗 Architecture\n{self.generate_diagrams()}\n\n")
+        append(f"## 📂 Project Structure\n{m['structure']}\n\n")
+        append(f"## ⚙️ Installation\n{self._generate_strict_install(langs)}")
+        append(f"## 🚀 Usage\n{self._generate_strict_usage(langs)}")
+
+        if has_api:
+            self._append_api_section(append)
+        if has_env:
+            self._append_env_section(append)
+        if has_docker:
+            append("## 🐳 Docker\n\n")
+            if m_docker["dockerfile"]:
+                append("Build and run using Docker:\n\n```bash\ndocker build -t my-app .\ndocker run -p 8000:8000 my-app\n```\n\n")
+            if m_docker["compose"]:
+                append("Or using Docker Compose:\n\n```bash\ndocker-compose up --build\n```\n\n")
+        if has_services:
+            append(self._generate_services_section())
 
         # Scripts Section
-        if m["scripts"]:
-            md += "## 📜 Scripts\n| Command | Description |\n|---|---|\n"
-            for k, v in m["scripts"].items():
-                md += f"| `npm run {k}` | {v} |\n"
-            md += "\n"
+        if has_scripts:
+            append("## 📜 Scripts\n| Command | Description |\n|---|---|\n"
+                   + "".join(f"| `npm run {k}` | {v} |\n" for k, v in m["scripts"].items())
+                   + "\n")
 
         # Dependencies Section
-        has_deps = any(m["dependencies"].values())
         if has_deps:
-            md += "## 📦 Dependencies\n"
+            append("## 📦 Dependencies\n")
             for l in langs:
-                if m["dependencies"].get(l):
-                    md += f"**{l}**\n"
-                    for d in sorted(list(m["dependencies"][l]))[:12]:
-                        md += f"- `{d}`\n"
-                    md += "\n"
+                deps = m_deps.get(l)
+                if deps:
+                    append(f"**{l}**\n"
+                           + "".join(f"- `{d}`\n" for d in heapq.nsmallest(12, deps))
+                           + "\n")
 
         # Testing Section
-        if m["tests"] or m["stats"]["test_files"] > 0:
-            md += "## 🧪 Testing\n"
+        if has_tests:
+            append("## 🧪 Testing\n")
             if m["tests"]:
-                md += "Detected testing tools/frameworks:\n\n"
-                md += ", ".join(sorted(set(m["tests"]))) + "\n\n"
-            if m["stats"]["test_files"] > 0:
-                md += f"- Approx. **{m['stats']['test_files']}** test files detected\n\n"
-
-            md += "To run the tests, execute (adjust as needed):\n```bash\n"
-            if any(t in m["tests"] for t in ["jest", "mocha"]):
-                md += "npm test\n"
+                append("Detected testing tools/frameworks:\n\n")
+                append(f"{', '.join(sorted(m['tests']))}\n\n")
+            if m_stats["test_files"] > 0:
+                append(f"- Approx. **{m_stats['test_files']}** test files detected\n\n")
+
+            if _JS_TEST_FRAMEWORKS & m["tests"]:
+                test_cmd = "npm test"
             elif "pytest" in m["tests"]:
-                md += "pytest\n"
+                test_cmd = "pytest"
+            # fallback based on language
+            elif "Node.js" in langs:
+                test_cmd = "npm test"
+            elif "Python" in langs:
+                test_cmd = "pytest"
             else:
-                # fallback based on language
-                if "Node.js" in langs:
-                    md += "npm test\n"
-                elif "Python" in langs:
-                    md += "pytest\n"
-                else:
-                    md += "# Run your test command here\n"
-            md += "```\n\n"
+                test_cmd = "# Run your test command here"
+            append(f"To run the tests, execute (adjust as needed):\n```bash\n{test_cmd}\n```\n\n")
 
         # Project Health section
-        md += self._generate_health_section()
+        append(self._generate_health_section())
 
-        md += "## 🤝 Contributing\n1. Fork the Project\n2. Create your Feature Branch\n3. Commit your Changes\n4. Push to the Branch\n5. Open a Pull Request\n\n"
+        append(_CONTRIB_BLOCK)
 
         # Next steps suggestions
-        md += self._generate_next_steps_section()
+        append(self._generate_next_steps_section())
 
-        md += f"## 📄 License\nThis project is licensed under the **{m['license']}**."
-        return md
+        append(f"## 📄 License\nThis project is licensed under the **{m['license']}**.")
+        return "".join(parts)
 
     # ---------- Helper section generators ----------
 
     def _has_tech_stack_details(self):
-        d = self.metadata.get("tech_stack_details", {})
-        return any(d.get(key) for key in ("frameworks", "databases", "auth", "cache"))
+        d = self.metadata.get("tech_stack_details") or {}
+        return any(d[key] for key in d.keys() & _TECH_DETAIL_KEYS)
 
     def _generate_tech_stack_list(self):
         d = self.metadata["tech_stack_details"]
         lines = []
         if d["frameworks"]:
-            lines.append(f"- **Frameworks:** " + ", ".join(sorted(d["frameworks"])))
+            lines.append(f"- **Frameworks:** {', '.join(sorted(d['frameworks']))}")
         if d["databases"]:
-            lines.append(f"- **Databases:** " + ", ".join(sorted(d["databases"])))
+            lines.append(f"- **Databases:** {', '.join(sorted(d['databases']))}")
         if d["auth"]:
-            lines.append(f"- **Auth:** " + ", ".join(sorted(d["auth"])))
+            lines.append(f"- **Auth:** {', '.join(sorted(d['auth']))}")
         if d["cache"]:
-            lines.append(f"- **Cache:** " + ", ".join(sorted(d["cache"])))
+            lines.append(f"- **Cache:** {', '.join(sorted(d['cache']))}")
         if not lines:
-            return "Languages: " + ", ".join(sorted(self.metadata["languages"])) + "\n"
+            return f"Languages: {', '.join(sorted(self.metadata['languages']))}\n"
         return "\n".join(lines) + "\n"
 
-    def _generate_env_section(self):
-        envs = sorted(list(self.metadata["env_vars"]))
-        if not envs:
-            return ""
-        md = "## 🔐 Environment Variables\n\n"
-        md += "Configure the following environment variables (e.g. in a `.env` file):\n\n"
-        md += "```bash\n"
-        for v in envs:
-            md += f"{v}=\n"
-        md += "```\n\n"
-        return md
-
-    def _generate_api_section(self):
-        eps = self.metadata["api_endpoints"]
-        if not eps:
-            return ""
-        md = "## 📡 API Endpoints (Auto-detected)\n\n"
-        for ep in eps:
-            md += f"- `{ep}`\n"
-        md += "\n> Note: This list is auto-generated and may be incomplete. Please review and update.\n\n"
-        return md
-
-    def _generate_docker_section(self):
-        d = self.metadata["docker"]
-        if not (d["dockerfile"] or d["compose"]):
-            return ""
-        md = "## 🐳 Docker\n\n"
-        if d["dockerfile"]:
-            md += "Build and run using Docker:\n\n```bash\ndocker build -t my-app .\ndocker run -p 8000:8000 my-app\n```\n\n"
-        if d["compose"]:
-            md += "Or using Docker Compose:\n\n```bash\ndocker-compose up --build\n```\n\n"
-        return md
+    def _append_env_section(self, append):
+        append("## 🔐 Environment Variables\n\n"
+               "Configure the following environment variables (e.g. in a `.env` file):\n\n"
+               "```bash\n")
+        for v in sorted(self.metadata["env_vars"]):
+            append(f"{v}=\n")
+        append("```\n\n")
+
+    def _append_api_section(self, append):
+        append("## 📡 API Endpoints (Auto-detected)\n\n")
+        for ep in self.metadata["api_endpoints"]:
+            append(f"- `{ep}`\n")
+        append("\n> Note: This list is auto-generated and may be incomplete. Please review and update.\n\n")
 
     def _generate_services_section(self):
         services = self.metadata["services"]
         if not services:
             return ""
-        md = "## 🧩 Services / Packages (Detected)\n\n"
-        for s in sorted(services, key=lambda x: x["name"]):
-            langs = ", ".join(s["languages"]) if s["languages"] else "Unknown"
-            md += f"### `{s['name']}/`\n"
-            md += f"- Path: `{s['path']}`\n"
-            md += f"- Languages: {langs}\n\n"
-        return md
+        parts = ["## 🧩 Services / Packages (Detected)\n\n"]
+        append = parts.append
+        for s in sorted(services, key=itemgetter("name")):
+            append(
+                f"### `{s['name']}/`\n"
+                f"- Path: `{s['path']}`\n"
+                f"- Languages: {', '.join(s['languages']) if s['languages'] else 'Unknown'}\n\n"
+            )
+        return "".join(parts)
 
     def _generate_health_section(self):
         stats = self.metadata["stats"]
-        md = "## 📊 Project Health Snapshot\n\n"
-        files = stats["files"]
-        total_files = sum(files.values())
-        md += f"- **Code Files (approx):** {total_files}\n"
-        for lang, count in files.items():
+        parts = ["## 📊 Project Health Snapshot\n\n"]
+        append = parts.append
+        total_files = 0
+        lang_lines = []
+        for lang, count in stats["files"].items():
             if count:
-                md += f"  - {lang}: {count}\n"
-        md += f"- **Test Files (approx):** {stats['test_files']}\n"
-        md += f"- **CI/CD Config:** {'Yes' if stats['has_ci'] else 'Not detected'}\n"
+                total_files += count
+                lang_lines.append(f"  - {lang}: {count}\n")
+        append(f"- **Code Files (approx):** {total_files}\n")
+        append("".join(lang_lines))
+        append(f"- **Test Files (approx):** {stats['test_files']}\n")
+        append(f"- **CI/CD Config:** {'Yes' if stats['has_ci'] else 'Not detected'}\n")
         if stats["linting"]:
-            md += "- **Linting/Formatting:** " + ", ".join(sorted(stats["linting"])) + "\n"
+            append(f"- **Linting/Formatting:** {', '.join(sorted(stats['linting']))}\n")
         else:
-            md += "- **Linting/Formatting:** Not detected\n"
-        md += "\n"
-        return md
+            append("- **Linting/Formatting:** Not detected\n")
+        append("\n")
+        return "".join(parts)
 
     def _generate_next_steps_section(self):
         m = self.metadata
         stats = m["stats"]
-        suggestions = []
-
-        if m["license"] in ["Unlicensed", "See LICENSE file"]:
-            suggestions.append("Add a proper LICENSE file (e.g., MIT, Apache 2.0).")
-        if stats["test_files"] == 0:
-            suggestions.append("Add automated tests (unit/integration) for critical parts.")
-        if not stats["has_ci"]:
-            suggestions.append("Set up a CI pipeline (GitHub Actions, GitLab CI, etc.).")
-        if not m["env_vars"]:
-            suggestions.append("Document required environment variables in the README or `.env.example`.")
-        if not any(m["dependencies"].values()):
-            suggestions.append("Add or document dependency management files (`requirements.txt`, `package.json`, etc.).")
-
-        if not suggestions:
-            suggestions.append("Project looks good! Consider improving documentation and adding more examples.")
-
-        md = "## 🔮 Suggested Next Steps (Auto-generated)\n\n"
-        for s in suggestions:
-            md += f"- [ ] {s}\n"
-        md += "\n"
-        return md
+        # bit i set <=> _NEXT_STEP_SUGGESTIONS[i] applies
+        mask = (
+            (m["license"] in ("Unlicensed", "See LICENSE file"))
+            | (stats["test_files"] == 0) << 1
+            | (not stats["has_ci"]) << 2
+            | (not m["env_vars"]) << 3
+            | (not any(m["dependencies"].values())) << 4
+        )
+        return _NEXT_STEPS_SECTIONS[mask]
 
     # ---------- Installation & Usage ----------
 
+    def _install_python(self):
+        parts = [_PYTHON_SETUP]
+        req_path = self.metadata.get("python_requirements_path")
+        if req_path:
+            parts.append(f"   pip install -r {req_path}\n")
+        elif self.metadata["dependencies"]["Python"]:
+            parts.append(f"   pip install {' '.join(islice(self.metadata['dependencies']['Python'], 5))}\n")
+        parts.append("   ```\n")
+        return "".join(parts)
+
+    def _install_java(self):
+        build_tools = self.metadata["build_tools"]
+        if "Maven" in build_tools:
+            return _MAVEN_SETUP
+        if "Gradle" in build_tools:
+            return _GRADLE_SETUP
+        return _JAVAC_SETUP
+
+    def _usage_node(self):
+        if "start" in self.metadata["scripts"]:
+            return "**Node.js:**\n```bash\nnpm start\n```\n"
+        entry = self.metadata["entry_points"].get("Node.js") or self.metadata["entry_point"] or "index.js"
+        return f"**Node.js:**\n```bash\nnode {entry}\n```\n"
+
+    def _usage_python(self):
+        entry = self.metadata["entry_points"].get("Python") or self.metadata["entry_point"] or "main.py"
+        # Detect FastAPI/Flask specifically for run command
+        if "fastapi" in self.metadata["dependencies"]["Python"]:
+            module = entry[:-3] if entry.endswith(".py") else entry
+            return f"**Python:**\n```bash\nuvicorn {module}:app --reload\n```\n"
+        return f"**Python:**\n```bash\npython {entry}\n```\n"
+
+    def _usage_java(self):
+        build_tools = self.metadata["build_tools"]
+        if "Maven" in build_tools:
+            return "**Java:**\n```bash\nmvn spring-boot:run\n```\n"
+        if "Gradle" in build_tools:
+            return "**Java:**\n```bash\n./gradlew bootRun\n```\n"
+        entry_cls = self.metadata["entry_point_cmd"]
+        entry_file = self.metadata["entry_points"].get("Java") or self.metadata["entry_point"]
+        if entry_cls and entry_file:
+            return f"**Java:**\n```bash\njavac {entry_file}\njava {entry_cls}\n```\n"
+        return "**Java:**\n```bash\njavac Main.java\njava Main\n```\n"
+
+    def _usage_go(self):
+        entry = self.metadata["entry_points"].get("Go") or self.metadata["entry_point"] or "main.go"
+        return f"**Go:**\n```bash\ngo run {entry}\n```\n"
+
+    # language -> install/usage step. Static steps are plain strings; the rest
+    # are plain functions called with self. Insertion order is output order.
+    _INSTALL_STEPS = {
+        "Node.js": _NODE_SETUP,
+        "Python": _install_python,
+        "Java": _install_java,
+        "Go": _GO_SETUP,
+    }
+    _USAGE_STEPS = {
+        "Node.js": _usage_node,
+        "Python": _usage_python,
+        "Java": _usage_java,
+        "Go": _usage_go,
+    }
+
     def _generate_strict_install(self, langs):
-        steps = (
+        parts = [
             "1. **Clone the repository**\n"
             "   ```bash\n"
             f"   git clone {self.metadata['repo_url']}\n"
             f"   cd {self.metadata['project_name']}\n"
             "   ```\n"
-        )
-
-        # Node.js
-        if "Node.js" in langs:
-            steps += "2. **Node.js Setup**\n   ```bash\n   npm install\n   ```\n"
-
-        # Python
-        if "Python" in langs:
-            steps += "2. **Python Setup**\n   ```bash\n   python -m venv venv\n   source venv/bin/activate\n"
-            req_path = self.metadata.get("python_requirements_path")
-            if req_path:
-                steps += f"   pip install -r {req_path}\n"
-            elif self.metadata["dependencies"]["Python"]:
-                steps += "   pip install " + " ".join(
-                    list(self.metadata["dependencies"]["Python"])[:5]
-                ) + "\n"
-            steps += "   ```\n"
-
-        # Java
-        if "Java" in langs:
-            steps += "2. **Java Setup**\n"
-            if "Maven" in self.metadata["build_tools"]:
-                steps += "   ```bash\n   mvn clean install\n   ```\n"
-            elif "Gradle" in self.metadata["build_tools"]:
-                steps += "   ```bash\n   ./gradlew build\n   ```\n"
-            else:
-                steps += "   ```bash\n   # Raw Java Project: Compile manually\n   javac *.java\n   ```\n"
-
-        # Go
-        if "Go" in langs:
-            steps += "2. **Go Setup**\n   ```bash\n   go mod tidy\n   ```\n"
-
-        return steps
+        ]
+        for lang, step in self._INSTALL_STEPS.items():
+            if lang in langs:
+                parts.append(step if isinstance(step, str) else step(self))
+        return "".join(parts)
 
     def _generate_strict_usage(self, langs):
-        cmd = ""
-
-        # Node.js
-        if "Node.js" in langs:
-            cmd += "**Node.js:**\n"
-            if "start" in self.metadata["scripts"]:
-                cmd += "```bash\nnpm start\n```\n"
-            else:
-                entry = self.metadata["entry_points"].get("Node.js") or self.metadata["entry_point"] or "index.js"
-                cmd += f"```bash\nnode {entry}\n```\n"
-
-        # Python
-        if "Python" in langs:
-            cmd += "**Python:**\n"
-            entry = self.metadata["entry_points"].get("Python") or self.metadata["entry_point"] or "main.py"
-            # Detect FastAPI/Flask specifically for run command
-            py_deps = self.metadata["dependencies"]["Python"]
-            if "fastapi" in py_deps:
-                cmd += f"```bash\nuvicorn {entry.replace('.py','')}:app --reload\n```\n"
-            else:
-                cmd += f"```bash\npython {entry}\n```\n"
-
-        # Java
-        if "Java" in langs:
-            cmd += "**Java:**\n"
-            if "Maven" in self.metadata["build_tools"]:
-                cmd += "```bash\nmvn spring-boot:run\n```\n"
-            elif "Gradle" in self.metadata["build_tools"]:
-                cmd += "```bash\n./gradlew bootRun\n```\n"
-            else:
-                entry_cls = self.metadata["entry_point_cmd"]
-                entry_file = self.metadata["entry_points"].get("Java") or self.metadata["entry_point"]
-                if entry_cls and entry_file:
-                    cmd += f"```bash\njavac {entry_file}\njava {entry_cls}\n```\n"
-                else:
-                    cmd += "```bash\njavac Main.java\njava Main\n```\n"
-
-        # Go
-        if "Go" in langs:
-            cmd += "**Go:**\n"
-            entry = self.metadata["entry_points"].get("Go") or self.metadata["entry_point"] or "main.go"
-            cmd += f"```bash\ngo run {entry}\n```\n"
-
-        return cmd
-
+        return "".join(step(self) for lang, step in self._USAGE_STEPS.items() if lang in langs)
 
 def generate_readme(path, template, context):
     scanner = DeepScanner(path, context)
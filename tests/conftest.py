@@ -0,0 +1,66 @@
+"""
+Shared pytest configuration.
+
+Hypothesis profiles: select one with the HYPOTHESIS_PROFILE environment
+variable, e.g. ``HYPOTHESIS_PROFILE=thorough pytest``. The ``ci`` profile runs
+fewer examples with a fixed seed so runs are reproducible; ``explicit`` runs only
+the ``@example`` cases, for a quick local check; ``xdist`` gives each
+pytest-xdist worker its own example database.
+
+Temporary files (tempfile.mkdtemp, tmp_path, tmp_path_factory) are placed on
+the /dev/shm tmpfs when it is available, unless TMPDIR is set explicitly.
+Each test process (including every pytest-xdist worker) gets its own
+freshly created directory there, removed as a whole when the session ends,
+so tests need not clean up after themselves.
+"""
+import os
+import shutil
+import tempfile
+
+from hypothesis import HealthCheck, Phase, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+
+settings.register_profile("fast", max_examples=20)
+settings.register_profile("thorough", max_examples=200)
+settings.register_profile("nightly", max_examples=1000)
+settings.register_profile("dev", max_examples=100)
+settings.register_profile(
+    "ci", max_examples=25, derandomize=True, deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile("explicit", phases=[Phase.explicit])
+settings.register_profile("xdist", database=DirectoryBasedExampleDatabase(
+    f".hypothesis/examples-{os.getenv('PYTEST_XDIST_WORKER', 'main')}"
+))
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
+
+RAMDISK = "/dev/shm"
+
+
+# Directory created for this process by pytest_configure, if any
+_session_root = None
+
+
+def pytest_configure(config):
+    """Point the tempfile root at a RAM-backed directory before any test runs"""
+    global _session_root
+    if "TMPDIR" in os.environ or not (os.path.isdir(RAMDISK) and os.access(RAMDISK, os.W_OK)):
+        return
+    try:
+        # mkdtemp gives a new 0700 directory owned by us, never a shared one
+        _session_root = tempfile.mkdtemp(dir=RAMDISK, prefix="autodocs-tests-")
+    except OSError:
+        return
+    tempfile.tempdir = _session_root
+
+
+def pytest_unconfigure(config):
+    """Remove everything this process left under its RAM-backed root in one sweep"""
+    global _session_root
+    if _session_root is None:
+        return
+    shutil.rmtree(_session_root, ignore_errors=True)
+    if tempfile.tempdir == _session_root:
+        tempfile.tempdir = None
+    _session_root = None
@@ -3,68 +3,65 @@ Property-based tests for dependency extraction.
 Tests Properties 7 and 8 from the design document.
 """
 import pytest
-from hypothesis import given, strategies as st, assume, settings
-from pathlib import Path
-import tempfile
+from hypothesis import given, example, strategies as st, assume, settings
 import os
 import json
-import shutil
 
 from app.extractors import DependencyExtractor, Dependency, Dependencies
 from app.detectors import ProjectType
 
 
+# Project types are immutable inputs; build them once instead of per example
+PY_PROJECT = ProjectType(language='Python', framework=None, config_files=['requirements.txt'])
+NODE_PROJECT = ProjectType(language='Node.js', framework=None, config_files=['package.json'])
+RUST_PROJECT = ProjectType(language='Rust', framework=None, config_files=['Cargo.toml'])
+
+# Every language paired with every config file, for the missing-file test
+MISMATCHED_PROJECTS = [
+    ProjectType(language=language, framework=None, config_files=[config_file])
+    for language in ('Python', 'Node.js', 'Rust')
+    for config_file in ('requirements.txt', 'package.json', 'Cargo.toml')
+]
+
+
 # Custom strategies for generating test data
 
-@st.composite
-def python_package_names(draw):
-    """Generate valid Python package names"""
-    # Python package names: ASCII letters, numbers, hyphens, underscores
-    # Must start with a letter
-    first_char = draw(st.sampled_from('abcdefghijklmnopqrstuvwxyz'))
-    rest = draw(st.text(
-        alphabet='abcdefghijklmnopqrstuvwxyz0123456789-_',
-        min_size=0,
-        max_size=49
-    ))
-    
-    return first_char + rest
+# Valid Python package names: must start with a letter, then letters,
+# digits, hyphens and underscores
+PKG = st.from_regex(r'[a-z][a-z0-9_-]{0,49}', fullmatch=True)
 
+# Valid Rust crate names: same alphabet, shorter
+CRATE = st.from_regex(r'[a-z][a-z0-9_-]{0,29}', fullmatch=True)
 
-@st.composite
-def version_strings(draw):
-    """Generate valid version strings"""
-    major = draw(st.integers(min_value=0, max_value=99))
-    minor = draw(st.integers(min_value=0, max_value=99))
-    patch = draw(st.integers(min_value=0, max_value=99))
-    
-    return f"{major}.{minor}.{patch}"
+# Valid MAJOR.MINOR.PATCH version strings, each part 0-99 without leading zeros
+VER = st.from_regex(r'(0|[1-9][0-9]?)\.(0|[1-9][0-9]?)\.(0|[1-9][0-9]?)', fullmatch=True)
+
+# Constant building blocks, constructed once rather than on every draw
+_BOOL = st.booleans()
+_OP = st.sampled_from(['==', '>=', '<=', '>', '<', '~='])
+_DEP_COUNT = st.integers(min_value=0, max_value=15)
+_VPREFIX = st.sampled_from(['^', '~', '', '>='])
+_DEV_VPREFIX = st.sampled_from(['^', '~', ''])
+_NODE_FIRST_CHAR = st.sampled_from('abcdefghijklmnopqrstuvwxyz0123456789')
+_PKG_LISTS = st.lists(PKG, unique=True, min_size=1, max_size=20)
+_CRATE_LISTS = st.lists(CRATE, unique=True, min_size=1, max_size=25)
 
 
 @st.composite
 def python_requirements_content(draw):
     """Generate valid requirements.txt content"""
-    num_packages = draw(st.integers(min_value=1, max_value=20))
+    names = draw(_PKG_LISTS)
     
     lines = []
     packages = []
-    seen_names = set()
     
-    for _ in range(num_packages):
-        package_name = draw(python_package_names())
-        
-        # Skip if we've already seen this package name
-        if package_name in seen_names:
-            continue
-        
-        seen_names.add(package_name)
-        
+    for package_name in names:
         # Sometimes include version, sometimes not
-        include_version = draw(st.booleans())
+        include_version = draw(_BOOL)
         
         if include_version:
-            version = draw(version_strings())
-            operator = draw(st.sampled_from(['==', '>=', '<=', '>', '<', '~=']))
+            version = draw(VER)
+            operator = draw(_OP)
             line = f"{package_name}{operator}{version}"
             packages.append((package_name, version))
         else:
@@ -74,141 +71,196 @@ def python_requirements_content(draw):
         lines.append(line)
     
     # Add some comments and empty lines
-    if draw(st.booleans()):
+    if draw(_BOOL):
         lines.insert(0, "# This is a comment")
     
-    if draw(st.booleans()):
+    if draw(_BOOL):
         lines.append("")
     
     return '\n'.join(lines), packages
 
 
+@st.composite
+def nodejs_name_parts(draw, max_size):
+    """Generate a Node.js name segment that starts with an alphanumeric character"""
+    first_char = draw(_NODE_FIRST_CHAR)
+    rest = draw(st.text(
+        alphabet='abcdefghijklmnopqrstuvwxyz0123456789-',
+        min_size=0,
+        max_size=max_size - 1
+    ))
+    
+    return first_char + rest
+
+
+_NODE_SCOPE = nodejs_name_parts(max_size=20)
+_NODE_NAME = nodejs_name_parts(max_size=50)
+
+
 @st.composite
 def nodejs_package_names(draw):
     """Generate valid Node.js package names"""
     # Can have scope like @scope/package
-    has_scope = draw(st.booleans())
+    has_scope = draw(_BOOL)
     
     if has_scope:
-        scope = draw(st.text(
-            alphabet='abcdefghijklmnopqrstuvwxyz0123456789-',
-            min_size=1,
-            max_size=20
-        ).filter(lambda x: x and x[0].isalnum()))
-        
-        package = draw(st.text(
-            alphabet='abcdefghijklmnopqrstuvwxyz0123456789-',
-            min_size=1,
-            max_size=50
-        ).filter(lambda x: x and x[0].isalnum()))
+        scope = draw(_NODE_SCOPE)
+        package = draw(_NODE_NAME)
         
         return f"@{scope}/{package}"
     else:
-        return draw(st.text(
-            alphabet='abcdefghijklmnopqrstuvwxyz0123456789-',
-            min_size=1,
-            max_size=50
-        ).filter(lambda x: x and x[0].isalnum()))
+        return draw(_NODE_NAME)
+
+
+NODE_PKG = nodejs_package_names()
 
 
 @st.composite
 def package_json_content(draw):
     """Generate valid package.json content"""
-    num_deps = draw(st.integers(min_value=0, max_value=15))
-    num_dev_deps = draw(st.integers(min_value=0, max_value=15))
+    num_deps = draw(_DEP_COUNT)
+    num_dev_deps = draw(_DEP_COUNT)
     
     dependencies = {}
     dev_dependencies = {}
     
     for _ in range(num_deps):
-        package_name = draw(nodejs_package_names())
-        version = draw(st.sampled_from([
-            f"^{draw(version_strings())}",
-            f"~{draw(version_strings())}",
-            f"{draw(version_strings())}",
-            f">={draw(version_strings())}",
-        ]))
+        package_name = draw(NODE_PKG)
+        version = f"{draw(_VPREFIX)}{draw(VER)}"
         dependencies[package_name] = version
     
     for _ in range(num_dev_deps):
-        package_name = draw(nodejs_package_names())
-        version = draw(st.sampled_from([
-            f"^{draw(version_strings())}",
-            f"~{draw(version_strings())}",
-            f"{draw(version_strings())}",
-        ]))
+        package_name = draw(NODE_PKG)
+        version = f"{draw(_DEV_VPREFIX)}{draw(VER)}"
         dev_dependencies[package_name] = version
     
     package_data = {
-        "name": draw(nodejs_package_names()),
-        "version": draw(version_strings()),
+        "name": draw(NODE_PKG),
+        "version": draw(VER),
         "dependencies": dependencies,
         "devDependencies": dev_dependencies
     }
     
-    return json.dumps(package_data, indent=2), dependencies, dev_dependencies
+    return json.dumps(package_data, separators=(',', ':')), dependencies, dev_dependencies
 
 
 @st.composite
 def cargo_toml_content(draw):
     """Generate valid Cargo.toml content"""
-    num_deps = draw(st.integers(min_value=1, max_value=15))
-    num_dev_deps = draw(st.integers(min_value=0, max_value=10))
+    # Draw all names unique up front, then split into disjoint sections
+    names = draw(_CRATE_LISTS)
+    num_deps = draw(st.integers(min_value=1, max_value=min(15, len(names))))
+    dep_names = names[:num_deps]
+    dev_dep_names = names[num_deps:num_deps + 10]
     
     lines = ['[package]']
     lines.append(f'name = "test-project"')
-    lines.append(f'version = "{draw(version_strings())}"')
+    lines.append(f'version = "{draw(VER)}"')
     lines.append('')
     lines.append('[dependencies]')
     
     dependencies = []
-    seen_names = set()
     
-    for _ in range(num_deps):
-        # Rust package names: ASCII letters, numbers, hyphens, underscores
-        first_char = draw(st.sampled_from('abcdefghijklmnopqrstuvwxyz'))
-        rest = draw(st.text(
-            alphabet='abcdefghijklmnopqrstuvwxyz0123456789-_',
-            min_size=0,
-            max_size=29
-        ))
-        package_name = first_char + rest
-        
-        # Skip if we've already seen this package name
-        if package_name in seen_names:
-            continue
-        
-        seen_names.add(package_name)
-        
-        version = draw(version_strings())
+    for package_name in dep_names:
+        version = draw(VER)
         lines.append(f'{package_name} = "{version}"')
         dependencies.append((package_name, version))
     
-    if num_dev_deps > 0:
+    if dev_dep_names:
         lines.append('')
         lines.append('[dev-dependencies]')
         
-        for _ in range(num_dev_deps):
-            first_char = draw(st.sampled_from('abcdefghijklmnopqrstuvwxyz'))
-            rest = draw(st.text(
-                alphabet='abcdefghijklmnopqrstuvwxyz0123456789-_',
-                min_size=0,
-                max_size=29
-            ))
-            package_name = first_char + rest
-            
-            # Skip if we've already seen this package name
-            if package_name in seen_names:
-                continue
-            
-            seen_names.add(package_name)
-            
-            version = draw(version_strings())
+        for package_name in dev_dep_names:
+            version = draw(VER)
             lines.append(f'{package_name} = "{version}"')
     
     return '\n'.join(lines), dependencies
 
 
+@pytest.fixture(scope="module")
+def extractor(tmp_path_factory):
+    """One DependencyExtractor shared by every example in this module"""
+    extractor = DependencyExtractor()
+    
+    # Run each parser once on an empty file so lazy imports happen here,
+    # not inside the first Hypothesis example
+    warm_dir = tmp_path_factory.mktemp("warmup")
+    for project_type in (PY_PROJECT, NODE_PROJECT, RUST_PROJECT):
+        (warm_dir / project_type.config_files[0]).write_bytes(b'')
+        extractor.extract_dependencies(project_type, str(warm_dir))
+    
+    return extractor
+
+
+@pytest.fixture(scope="module")
+def work_dir(tmp_path_factory):
+    """Directory reused across examples; holds one subdirectory per config file"""
+    return tmp_path_factory.mktemp("deps")
+
+
+@pytest.fixture(scope="module")
+def write_config(work_dir):
+    """Overwrite a config file through an fd opened once per file; returns its directory.
+
+    Each config file gets its own subdirectory of work_dir, so leftovers from
+    one project type never reach another's extraction.
+    """
+    fds = {}
+    
+    def write(config_file, content):
+        project_dir = work_dir / config_file.replace('.', '_')
+        fd = fds.get(config_file)
+        if fd is None:
+            project_dir.mkdir(exist_ok=True)
+            fd = fds[config_file] = os.open(
+                project_dir / config_file, os.O_CREAT | os.O_WRONLY | os.O_TRUNC
+            )
+        os.ftruncate(fd, 0)
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, content.encode('utf-8'))
+        return project_dir
+    
+    yield write
+    
+    for fd in fds.values():
+        os.close(fd)
+
+
+@pytest.fixture(scope="module")
+def empty_dir(tmp_path_factory):
+    """Directory that never contains a config file"""
+    return tmp_path_factory.mktemp("empty")
+
+
+def _extract(extractor, write_config, project_type, content):
+    """Write ``content`` as the project's config file and extract its dependencies"""
+    project_dir = write_config(project_type.config_files[0], content)
+    return extractor.extract_dependencies(project_type, str(project_dir))
+
+
+def _assert_names(extracted, expected_names, label):
+    """Assert the extracted dependency names are exactly ``expected_names``"""
+    extracted_names = {dep.name for dep in extracted}
+    assert extracted_names == expected_names, \
+        f"Expected {label} {expected_names}, got {extracted_names}"
+
+
+def _assert_well_formed(deps, dev):
+    """Assert every entry is a Dependency with a non-empty name and the given dev flag"""
+    if all(isinstance(dep, Dependency) and isinstance(dep.name, str) and dep.name
+           and dep.dev is dev for dep in deps):
+        return
+    
+    # Slow path: re-check one by one to report the offending entry
+    for dep in deps:
+        assert isinstance(dep, Dependency), \
+            f"{dep!r} should be a Dependency object"
+        assert isinstance(dep.name, str) and dep.name, \
+            f"{dep!r} name should be a non-empty string"
+        assert dep.dev is dev, \
+            f"Dependency {dep.name} should have dev={dev}"
+
+
 # Property 7: Dependency extraction correctness
 # Feature: readme-generator, Property 7: Dependency extraction correctness
 # Validates: Requirements 4.1, 4.2, 4.3
@@ -216,264 +268,124 @@ def cargo_toml_content(draw):
 class TestDependencyExtractionCorrectness:
     """Test that dependencies are correctly extracted from configuration files"""
     
+    # Also covers Property 8 for Python, sharing one file write per example
     @given(content_data=python_requirements_content())
+    @example(content_data=("flask\nrequests==2.31.0", [("flask", None), ("requests", "2.31.0")]))
+    @example(content_data=("# This is a comment\nnumpy>=1.2.3\n", [("numpy", "1.2.3")]))
     @settings(max_examples=100)
-    def test_python_requirements_extraction(self, content_data):
-        """For any valid requirements.txt, all dependencies should be extracted"""
+    def test_python_end_to_end(self, extractor, write_config, content_data):
+        """For any valid requirements.txt, all dependencies should be extracted and well-formed"""
         content, expected_packages = content_data
         
-        # Create temporary directory and file
-        temp_dir = tempfile.mkdtemp()
-        requirements_file = Path(temp_dir) / 'requirements.txt'
+        dependencies = _extract(extractor, write_config, PY_PROJECT, content)
         
-        try:
-            requirements_file.write_text(content)
-            
-            # Create project type
-            project_type = ProjectType(
-                language='Python',
-                framework=None,
-                config_files=['requirements.txt']
-            )
-            
-            # Extract dependencies
-            extractor = DependencyExtractor()
-            dependencies = extractor.extract_dependencies(project_type, temp_dir)
-            
-            # Verify all packages are extracted
-            extracted_names = {dep.name for dep in dependencies.runtime}
-            expected_names = {pkg[0] for pkg in expected_packages}
-            
-            assert extracted_names == expected_names, \
-                f"Expected packages {expected_names}, got {extracted_names}"
-            
-            # Verify versions are extracted correctly
-            for dep in dependencies.runtime:
-                matching_packages = [pkg for pkg in expected_packages if pkg[0] == dep.name]
-                if matching_packages:
-                    expected_version = matching_packages[0][1]
-                    if expected_version:
-                        assert dep.version is not None, \
-                            f"Package {dep.name} should have version {expected_version}"
+        # Verify structure
+        assert isinstance(dependencies, Dependencies), \
+            "Output should be Dependencies object"
+        assert isinstance(dependencies.runtime, list), \
+            "Runtime dependencies should be a list"
+        assert isinstance(dependencies.development, list), \
+            "Development dependencies should be a list"
+        _assert_well_formed(dependencies.runtime, dev=False)
         
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        # Verify all packages are extracted
+        _assert_names(dependencies.runtime, {pkg[0] for pkg in expected_packages}, "packages")
+        
+        # Verify versions are extracted correctly
+        for dep in dependencies.runtime:
+            matching_packages = [pkg for pkg in expected_packages if pkg[0] == dep.name]
+            if matching_packages:
+                expected_version = matching_packages[0][1]
+                if expected_version:
+                    assert dep.version is not None, \
+                        f"Package {dep.name} should have version {expected_version}"
     
     @given(content_data=package_json_content())
     @settings(max_examples=100)
-    def test_nodejs_package_json_extraction(self, content_data):
+    def test_nodejs_package_json_extraction(self, extractor, write_config, content_data):
         """For any valid package.json, all dependencies should be extracted"""
         content, expected_deps, expected_dev_deps = content_data
         
-        # Create temporary directory and file
-        temp_dir = tempfile.mkdtemp()
-        package_file = Path(temp_dir) / 'package.json'
+        dependencies = _extract(extractor, write_config, NODE_PROJECT, content)
         
-        try:
-            package_file.write_text(content)
-            
-            # Create project type
-            project_type = ProjectType(
-                language='Node.js',
-                framework=None,
-                config_files=['package.json']
-            )
-            
-            # Extract dependencies
-            extractor = DependencyExtractor()
-            dependencies = extractor.extract_dependencies(project_type, temp_dir)
-            
-            # Verify runtime dependencies
-            extracted_runtime_names = {dep.name for dep in dependencies.runtime}
-            expected_runtime_names = set(expected_deps.keys())
-            
-            assert extracted_runtime_names == expected_runtime_names, \
-                f"Expected runtime deps {expected_runtime_names}, got {extracted_runtime_names}"
-            
-            # Verify dev dependencies
-            extracted_dev_names = {dep.name for dep in dependencies.development}
-            expected_dev_names = set(expected_dev_deps.keys())
-            
-            assert extracted_dev_names == expected_dev_names, \
-                f"Expected dev deps {expected_dev_names}, got {extracted_dev_names}"
-            
-            # Verify versions are extracted
-            for dep in dependencies.runtime:
-                assert dep.version is not None, f"Runtime dependency {dep.name} should have version"
-            
-            for dep in dependencies.development:
-                assert dep.version is not None, f"Dev dependency {dep.name} should have version"
+        # Verify runtime and dev dependencies
+        _assert_names(dependencies.runtime, set(expected_deps), "runtime deps")
+        _assert_names(dependencies.development, set(expected_dev_deps), "dev deps")
         
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        # Verify versions are extracted
+        for dep in dependencies.runtime:
+            assert dep.version is not None, f"Runtime dependency {dep.name} should have version"
+        
+        for dep in dependencies.development:
+            assert dep.version is not None, f"Dev dependency {dep.name} should have version"
     
     @given(content_data=cargo_toml_content())
     @settings(max_examples=100)
-    def test_rust_cargo_toml_extraction(self, content_data):
+    def test_rust_cargo_toml_extraction(self, extractor, write_config, content_data):
         """For any valid Cargo.toml, all dependencies should be extracted"""
         content, expected_deps = content_data
         
-        # Create temporary directory and file
-        temp_dir = tempfile.mkdtemp()
-        cargo_file = Path(temp_dir) / 'Cargo.toml'
+        dependencies = _extract(extractor, write_config, RUST_PROJECT, content)
         
-        try:
-            cargo_file.write_text(content)
-            
-            # Create project type
-            project_type = ProjectType(
-                language='Rust',
-                framework=None,
-                config_files=['Cargo.toml']
-            )
-            
-            # Extract dependencies
-            extractor = DependencyExtractor()
-            dependencies = extractor.extract_dependencies(project_type, temp_dir)
-            
-            # Verify all packages are extracted
-            extracted_names = {dep.name for dep in dependencies.runtime}
-            expected_names = {pkg[0] for pkg in expected_deps}
-            
-            assert extracted_names == expected_names, \
-                f"Expected packages {expected_names}, got {extracted_names}"
-            
-            # Verify versions are extracted
-            for dep in dependencies.runtime:
-                assert dep.version is not None, f"Dependency {dep.name} should have version"
+        # Verify all packages are extracted
+        _assert_names(dependencies.runtime, {pkg[0] for pkg in expected_deps}, "packages")
         
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        # Verify versions are extracted
+        for dep in dependencies.runtime:
+            assert dep.version is not None, f"Dependency {dep.name} should have version"
 
 
 # Property 8: Structured dependency output
 # Feature: readme-generator, Property 8: Structured dependency output
 # Validates: Requirements 4.5
+#
+# Shape-only checks don't benefit from fuzzing, so they run over fixed cases.
+# Python structure is checked alongside correctness in test_python_end_to_end.
+
+NODE_STRUCTURE_CASES = [
+    json.dumps({"name": "demo", "version": "1.0.0",
+                "dependencies": {}, "devDependencies": {}}),
+    json.dumps({"name": "demo", "version": "1.0.0",
+                "dependencies": {"express": "^4.18.2"},
+                "devDependencies": {}}),
+    json.dumps({"name": "demo", "version": "1.0.0",
+                "dependencies": {},
+                "devDependencies": {"jest": "29.7.0"}}),
+    json.dumps({"name": "demo", "version": "1.0.0",
+                "dependencies": {"react": "~18.2.0", "@scope/pkg": ">=1.0.0"},
+                "devDependencies": {"@types/node": "~20.1.0", "eslint": "^8.0.0"}}),
+]
+
 
 class TestStructuredDependencyOutput:
     """Test that extracted dependencies are properly structured"""
     
-    @given(content_data=python_requirements_content())
-    @settings(max_examples=100)
-    def test_python_dependencies_structure(self, content_data):
-        """For any extracted Python dependencies, output should be structured correctly"""
-        content, expected_packages = content_data
-        
-        # Create temporary directory and file
-        temp_dir = tempfile.mkdtemp()
-        requirements_file = Path(temp_dir) / 'requirements.txt'
-        
-        try:
-            requirements_file.write_text(content)
-            
-            project_type = ProjectType(
-                language='Python',
-                framework=None,
-                config_files=['requirements.txt']
-            )
-            
-            extractor = DependencyExtractor()
-            dependencies = extractor.extract_dependencies(project_type, temp_dir)
-            
-            # Verify structure
-            assert isinstance(dependencies, Dependencies), \
-                "Output should be Dependencies object"
-            
-            assert isinstance(dependencies.runtime, list), \
-                "Runtime dependencies should be a list"
-            
-            assert isinstance(dependencies.development, list), \
-                "Development dependencies should be a list"
-            
-            # Verify each dependency has correct structure
-            for dep in dependencies.runtime:
-                assert isinstance(dep, Dependency), \
-                    "Each dependency should be a Dependency object"
-                assert isinstance(dep.name, str), \
-                    "Dependency name should be a string"
-                assert dep.name, "Dependency name should not be empty"
-                assert isinstance(dep.dev, bool), \
-                    "Dependency dev flag should be boolean"
-                assert dep.dev is False, \
-                    "Runtime dependencies should have dev=False"
-        
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
-    
-    @given(content_data=package_json_content())
-    @settings(max_examples=100)
-    def test_nodejs_dependencies_structure(self, content_data):
+    @pytest.mark.parametrize('content', NODE_STRUCTURE_CASES)
+    def test_nodejs_dependencies_structure(self, extractor, write_config, content):
         """For any extracted Node.js dependencies, output should be structured correctly"""
-        content, expected_deps, expected_dev_deps = content_data
+        dependencies = _extract(extractor, write_config, NODE_PROJECT, content)
         
-        # Create temporary directory and file
-        temp_dir = tempfile.mkdtemp()
-        package_file = Path(temp_dir) / 'package.json'
+        # Verify structure
+        assert isinstance(dependencies, Dependencies), \
+            "Output should be Dependencies object"
         
-        try:
-            package_file.write_text(content)
-            
-            project_type = ProjectType(
-                language='Node.js',
-                framework=None,
-                config_files=['package.json']
-            )
-            
-            extractor = DependencyExtractor()
-            dependencies = extractor.extract_dependencies(project_type, temp_dir)
-            
-            # Verify structure
-            assert isinstance(dependencies, Dependencies), \
-                "Output should be Dependencies object"
-            
-            # Verify runtime dependencies structure
-            for dep in dependencies.runtime:
-                assert isinstance(dep, Dependency), \
-                    "Each dependency should be a Dependency object"
-                assert isinstance(dep.name, str) and dep.name, \
-                    "Dependency name should be non-empty string"
-                assert dep.dev is False, \
-                    "Runtime dependencies should have dev=False"
-            
-            # Verify development dependencies structure
-            for dep in dependencies.development:
-                assert isinstance(dep, Dependency), \
-                    "Each dev dependency should be a Dependency object"
-                assert isinstance(dep.name, str) and dep.name, \
-                    "Dev dependency name should be non-empty string"
-                assert dep.dev is True, \
-                    "Development dependencies should have dev=True"
-        
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        # Verify runtime and development dependencies structure
+        _assert_well_formed(dependencies.runtime, dev=False)
+        _assert_well_formed(dependencies.development, dev=True)
     
-    @given(
-        language=st.sampled_from(['Python', 'Node.js', 'Rust']),
-        config_file=st.sampled_from(['requirements.txt', 'package.json', 'Cargo.toml'])
+    @pytest.mark.parametrize(
+        'project_type', MISMATCHED_PROJECTS,
+        ids=[f"{p.language}-{p.config_files[0]}" for p in MISMATCHED_PROJECTS]
     )
-    @settings(max_examples=50)
-    def test_empty_or_missing_files_return_empty_structure(self, language, config_file):
+    def test_empty_or_missing_files_return_empty_structure(self, extractor, empty_dir, project_type):
         """For any missing or empty config file, should return empty but valid structure"""
-        # Create temporary directory without config file
-        temp_dir = tempfile.mkdtemp()
-        
-        try:
-            project_type = ProjectType(
-                language=language,
-                framework=None,
-                config_files=[config_file]
-            )
-            
-            extractor = DependencyExtractor()
-            dependencies = extractor.extract_dependencies(project_type, temp_dir)
-            
-            # Should return valid structure even if empty
-            assert isinstance(dependencies, Dependencies), \
-                "Should return Dependencies object even for missing files"
-            assert isinstance(dependencies.runtime, list), \
-                "Runtime should be a list"
-            assert isinstance(dependencies.development, list), \
-                "Development should be a list"
+        # empty_dir never receives a config file
+        dependencies = extractor.extract_dependencies(project_type, str(empty_dir))
         
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        # Should return valid structure even if empty
+        assert isinstance(dependencies, Dependencies), \
+            "Should return Dependencies object even for missing files"
+        assert isinstance(dependencies.runtime, list), \
+            "Runtime should be a list"
+        assert isinstance(dependencies.development, list), \
+            "Development should be a list"
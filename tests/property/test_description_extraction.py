@@ -0,0 +1,246 @@
+"""
+Property-based tests for description extraction.
+Tests Property 14 from the design document.
+
+Selection tests (Property 15) never touch disk and live in
+test_description_selection.py.
+"""
+import pytest
+from hypothesis import given, strategies as st, settings
+from pathlib import Path
+import itertools
+import string
+
+from app.extractors import DescriptionExtractor
+from app.scanner import FileInfo, ProjectStructure
+from app.detectors import ProjectType
+
+
+# Custom strategies for generating test data
+
+# Small ASCII alphabet: the parsers only care about line structure, and
+# drawing from whole Unicode categories is far slower per example
+ALPHA = string.ascii_letters + string.digits + ' .,!?-'
+_LINE = st.text(alphabet=ALPHA, min_size=10, max_size=100)
+
+# (extension, line-comment starter) pairs for header-comment files
+_FILE_TYPES = (('.py', '#'), ('.js', '//'), ('.rs', '//'), ('.rb', '#'))
+_FILE_TYPE_ST = st.sampled_from(_FILE_TYPES)
+
+
+@st.composite
+def python_file_with_docstring(draw):
+    """
+    Generate a Python source with a module-level docstring.
+    Returns tuple of (source, expected_docstring)
+    """
+    # Generate a docstring with safe characters (letters, numbers, spaces, basic punctuation)
+    docstring_lines = draw(st.lists(
+        _LINE,
+        min_size=1,
+        max_size=5
+    ))
+    docstring = ' '.join(line.strip() for line in docstring_lines if line.strip())
+    
+    # Ensure we have a non-empty docstring
+    if not docstring:
+        docstring = "This is a test module"
+    
+    # Python source with module docstring
+    source = (
+        f'"""\n{docstring}\n"""\n\n'
+        'def some_function():\n'
+        '    pass\n'
+    )
+    
+    return source, docstring
+
+
+@st.composite
+def file_with_header_comment(draw):
+    """
+    Generate a source file with header comments.
+    Returns tuple of (source, expected_comment, extension)
+    """
+    # Choose file type
+    extension, comment_char = draw(_FILE_TYPE_ST)
+    
+    # Generate comment lines with safe characters
+    comment_lines = draw(st.lists(
+        _LINE,
+        min_size=1,
+        max_size=5
+    ))
+    
+    # Clean up comment lines
+    comment_lines = [line.strip() for line in comment_lines if line.strip()]
+    if not comment_lines:
+        comment_lines = ["This is a test file"]
+    
+    # Source with header comments
+    source = ''.join(f'{comment_char} {line}\n' for line in comment_lines)
+    source += '\n# Some code here\n'
+    
+    expected_comment = ' '.join(comment_lines)
+    
+    return source, expected_comment, extension
+
+
+@st.composite
+def project_with_descriptions(draw):
+    """
+    Generate the files of a project containing descriptions.
+    Returns tuple of (files, has_descriptions) where files is a list of
+    (filename, content) pairs
+    """
+    # main.py with docstring
+    docstring = draw(st.text(min_size=20, max_size=200))
+    files = [('main.py', f'"""\n{docstring}\n"""\n\ndef main():\n    pass\n')]
+    has_descriptions = True
+    
+    # Optionally add more files
+    num_extra_files = draw(st.integers(min_value=0, max_value=5))
+    for i in range(num_extra_files):
+        files.append((f'module_{i}.py', f'# Module {i}\n'))
+    
+    return files, has_descriptions
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    """One DescriptionExtractor shared by every example in this module"""
+    return DescriptionExtractor()
+
+
+@pytest.fixture(scope="module")
+def work_dir(tmp_path_factory):
+    """Directory reused across examples; pytest's tmp retention cleans it up"""
+    return tmp_path_factory.mktemp("desc")
+
+
+def _write_file(path, content):
+    """Write ``content`` to ``path`` and return the path as a string"""
+    path.write_text(content, encoding='utf-8')
+    return str(path)
+
+
+_project_ids = itertools.count()
+
+
+def _write_project(work_dir, files):
+    """Write ``files`` into a fresh subdirectory and describe it as a ProjectStructure"""
+    root = work_dir / f'ex_{next(_project_ids)}'
+    root.mkdir()
+    
+    file_infos = []
+    for filename, content in files:
+        _write_file(root / filename, content)
+        file_infos.append(FileInfo(
+            path=filename,
+            name=filename,
+            extension='.py',
+            size=len(content.encode('utf-8'))
+        ))
+    
+    return ProjectStructure(
+        root_path=str(root),
+        files=file_infos,
+        directories=[],
+        tree=""
+    )
+
+
+# Property 14: Description extraction from code
+# Feature: readme-generator, Property 14: Description extraction from code
+# Validates: Requirements 6.1, 6.2
+
+class TestDescriptionExtractionFromCode:
+    """Test that description extractor extracts text from code comments and docstrings"""
+    
+    @given(file_data=python_file_with_docstring())
+    @settings(deadline=None)
+    def test_extracts_python_module_docstrings(self, extractor, work_dir, file_data):
+        """For any Python file with module docstring, extractor should extract it"""
+        source, expected_docstring = file_data
+        temp_file = _write_file(work_dir / 'test_module.py', source)
+        
+        # Extract docstrings
+        docstrings = extractor.extract_python_docstrings(temp_file)
+        
+        assert len(docstrings) > 0, \
+            "Should extract at least one docstring"
+        
+        # The expected docstring should be in the extracted docstrings
+        # (accounting for whitespace normalization)
+        expected_stripped = expected_docstring.strip()
+        assert expected_stripped in {ds.strip() for ds in docstrings}, \
+            f"Expected docstring should be extracted"
+    
+    @given(file_data=file_with_header_comment())
+    @settings(deadline=None)
+    def test_extracts_header_comments(self, extractor, work_dir, file_data):
+        """For any file with header comments, extractor should extract them"""
+        source, expected_comment, extension = file_data
+        temp_file = _write_file(work_dir / f'test_file{extension}', source)
+        
+        # Extract header comments
+        header_comment = extractor.extract_header_comments(temp_file)
+        
+        # Should extract something
+        assert header_comment is not None, \
+            f"Should extract header comment from {extension} file"
+        
+        # The extracted comment should contain the expected text
+        # (allowing for some whitespace differences)
+        assert len(header_comment) > 0, \
+            "Extracted comment should not be empty"
+    
+    @given(
+        docstring_length=st.integers(min_value=20, max_value=500),
+        num_functions=st.integers(min_value=0, max_value=5)
+    )
+    @settings(deadline=None)
+    def test_extracts_from_various_python_structures(self, extractor, work_dir, docstring_length, num_functions):
+        """For any Python file structure, extractor should find docstrings"""
+        # Create Python file with module docstring and function docstrings
+        module_doc = 'A' * docstring_length
+        source = f'"""{module_doc}"""\n\n' + ''.join(
+            f'def function_{i}():\n'
+            f'    """Function {i} docstring"""\n'
+            f'    pass\n\n'
+            for i in range(num_functions)
+        )
+        temp_file = _write_file(work_dir / 'module.py', source)
+        
+        docstrings = extractor.extract_python_docstrings(temp_file)
+        
+        # Should extract at least the module docstring
+        assert len(docstrings) >= 1, \
+            "Should extract at least module docstring"
+        
+        # Module docstring should be first
+        assert module_doc in docstrings[0], \
+            "Module docstring should be extracted"
+    
+    @given(project=project_with_descriptions())
+    @settings(deadline=None)
+    def test_extract_description_finds_content(self, extractor, work_dir, project):
+        """For any project with description content, extractor should find it"""
+        files, has_descriptions = project
+        structure = _write_project(work_dir, files)
+        
+        project_type = ProjectType(language='Python')
+        
+        # Extract description
+        description = extractor.extract_description(structure, project_type)
+        
+        assert description is not None, \
+            "Should return a description"
+        assert len(description) > 0, \
+            "Description should not be empty"
+        
+        if has_descriptions:
+            # Should not just be the folder name fallback
+            folder_name = Path(structure.root_path).name
+            assert description != f"A {folder_name} project" or len(description) > 20, \
+                "Should extract actual description when available"
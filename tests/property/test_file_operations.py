@@ -3,47 +3,19 @@ Property-based tests for file save operations.
 Tests Property 21 from the design document.
 """
 import pytest
-from hypothesis import given, strategies as st, assume, settings
+from hypothesis import given, strategies as st, assume
 from pathlib import Path
-import tempfile
+import itertools
 import os
-import shutil
+import string
 
 from app.validators import InputValidator
 
 
 # Custom strategies for generating test data
 
-@st.composite
-def valid_project_paths(draw):
-    """Generate valid project directory paths"""
-    # Create a temporary directory that we know exists
-    temp_dir = tempfile.mkdtemp()
-    return temp_dir
-
-
-@st.composite
-def readme_content(draw):
-    """Generate valid README content"""
-    # Generate markdown-like content (filter out line breaks and invalid unicode to avoid issues)
-    title = draw(st.text(
-        alphabet=st.characters(
-            blacklist_characters='\r\n',
-            blacklist_categories=('Cs',)  # Exclude surrogates
-        ),
-        min_size=1, 
-        max_size=100
-    ))
-    description = draw(st.text(
-        alphabet=st.characters(
-            blacklist_characters='\r\n',
-            blacklist_categories=('Cs',)  # Exclude surrogates
-        ),
-        min_size=10, 
-        max_size=500
-    ))
-    
-    content = f"""# {title}
+# The fixed README body; only the title and description vary per example
+README_TEMPLATE = """# {title}
 
 {description}
 
@@ -71,7 +43,41 @@ npm start
 
 MIT
 """
-    return content
+
+# Title and description are opaque payload for the save round-trip, so keep them
+# short and draw from a small fixed alphabet; a few non-ASCII characters keep the
+# UTF-8 encoding path covered
+ALPHA = string.ascii_letters + string.digits + ' .,!?-_éü✓'
+_TITLE = st.text(alphabet=ALPHA, min_size=1, max_size=40)
+_DESCRIPTION = st.text(alphabet=ALPHA, min_size=10, max_size=120)
+
+
+@st.composite
+def readme_content(draw):
+    """Generate valid README content"""
+    return README_TEMPLATE.format(title=draw(_TITLE), description=draw(_DESCRIPTION))
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """One InputValidator shared by every example in this module"""
+    return InputValidator()
+
+
+@pytest.fixture(scope="module")
+def work_dir(tmp_path_factory):
+    """Parent of every example's project directory; pytest's tmp retention cleans it up"""
+    return tmp_path_factory.mktemp("save")
+
+
+_project_ids = itertools.count()
+
+
+def _new_project_dir(work_dir):
+    """Create a fresh, empty project directory under ``work_dir``"""
+    project_dir = work_dir / f'project_{next(_project_ids)}'
+    project_dir.mkdir()
+    return project_dir
 
 
 # Property 21: File save to correct location
@@ -81,114 +87,69 @@ MIT
 class TestFileSaveLocation:
     """Test that README files are saved to the correct location"""
     
-    @given(
-        project_path=valid_project_paths(),
-        content=readme_content()
-    )
-    @settings(max_examples=100)
-    def test_readme_saved_to_project_root(self, project_path, content):
+    @given(content=readme_content())
+    def test_readme_saved_to_project_root(self, validator, work_dir, content):
         """For any local project path, the README.md should be saved to the root directory"""
-        try:
-            # Validate the project path
-            validator = InputValidator()
-            validation_result = validator.validate_local_path(project_path)
-            
-            assert validation_result.valid, "Project path should be valid"
-            
-            # Construct expected README path
-            project_dir = Path(validation_result.sanitized_input)
-            expected_readme_path = project_dir / "README.md"
-            
-            # Write the README file
-            with open(expected_readme_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            # Verify the file exists at the correct location
-            assert expected_readme_path.exists(), "README.md should exist at project root"
-            assert expected_readme_path.is_file(), "README.md should be a file"
-            
-            # Verify the content matches (normalize line endings for cross-platform compatibility)
-            with open(expected_readme_path, 'r', encoding='utf-8') as f:
-                saved_content = f.read()
-            
-            # Normalize line endings for comparison
-            normalized_saved = saved_content.replace('\r\n', '\n')
-            normalized_content = content.replace('\r\n', '\n')
-            
-            assert normalized_saved == normalized_content, "Saved content should match original content"
-            
-            # Verify it's in the root directory (not a subdirectory)
-            assert expected_readme_path.parent == project_dir, "README.md should be in project root"
-            
-        finally:
-            # Cleanup
-            if os.path.exists(project_path):
-                shutil.rmtree(project_path, ignore_errors=True)
+        project_path = str(_new_project_dir(work_dir))
+        
+        # Validate the project path
+        validation_result = validator.validate_local_path(project_path)
+        
+        assert validation_result.valid, "Project path should be valid"
+        
+        # Construct expected README path
+        project_dir = Path(validation_result.sanitized_input)
+        expected_readme_path = project_dir / "README.md"
+        
+        # Write the README file
+        expected_readme_path.write_bytes(content.encode('utf-8'))
+        
+        # Verify the file exists at the correct location
+        assert expected_readme_path.exists(), "README.md should exist at project root"
+        assert expected_readme_path.is_file(), "README.md should be a file"
+        
+        # Verify the content matches (bytes mode: no newline translation on any platform)
+        saved_content = expected_readme_path.read_bytes().decode('utf-8')
+        
+        assert saved_content == content, "Saved content should match original content"
+        
+        # Verify it's in the root directory (not a subdirectory)
+        assert expected_readme_path.parent == project_dir, "README.md should be in project root"
     
-    @given(
-        project_path=valid_project_paths(),
-        content=readme_content()
-    )
-    @settings(max_examples=100)
-    def test_readme_overwrite_existing_file(self, project_path, content):
+    @given(content=readme_content())
+    def test_readme_overwrite_existing_file(self, work_dir, content):
         """For any project with existing README, new content should overwrite it"""
-        try:
-            # Create an existing README with different content
-            project_dir = Path(project_path)
-            readme_path = project_dir / "README.md"
-            
-            old_content = "# Old README\n\nThis is old content."
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(old_content)
-            
-            assert readme_path.exists(), "Old README should exist"
-            
-            # Write new content
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            # Verify the file was overwritten (normalize line endings for cross-platform compatibility)
-            with open(readme_path, 'r', encoding='utf-8') as f:
-                saved_content = f.read()
-            
-            # Normalize line endings for comparison
-            normalized_saved = saved_content.replace('\r\n', '\n')
-            normalized_content = content.replace('\r\n', '\n')
-            normalized_old = old_content.replace('\r\n', '\n')
-            
-            assert normalized_saved == normalized_content, "New content should overwrite old content"
-            assert normalized_saved != normalized_old, "Content should be different from old content"
-            
-        finally:
-            # Cleanup
-            if os.path.exists(project_path):
-                shutil.rmtree(project_path, ignore_errors=True)
+        # Create an existing README with different content
+        project_dir = _new_project_dir(work_dir)
+        readme_path = project_dir / "README.md"
+        
+        old_content = "# Old README\n\nThis is old content."
+        readme_path.write_bytes(old_content.encode('utf-8'))
+        
+        assert readme_path.exists(), "Old README should exist"
+        
+        # Write new content
+        readme_path.write_bytes(content.encode('utf-8'))
+        
+        # Verify the file was overwritten (bytes mode: no newline translation on any platform)
+        saved_content = readme_path.read_bytes().decode('utf-8')
+        
+        assert saved_content == content, "New content should overwrite old content"
+        assert saved_content != old_content, "Content should be different from old content"
     
-    @given(
-        project_path=valid_project_paths(),
-        content=readme_content()
-    )
-    @settings(max_examples=50)
-    def test_readme_filename_is_correct(self, project_path, content):
+    @given(content=readme_content())
+    def test_readme_filename_is_correct(self, work_dir, content):
         """For any saved README, the filename should be exactly 'README.md'"""
-        try:
-            project_dir = Path(project_path)
-            readme_path = project_dir / "README.md"
-            
-            # Write the README
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            # Verify the filename
-            assert readme_path.name == "README.md", "Filename should be exactly 'README.md'"
-            assert readme_path.suffix == ".md", "File extension should be .md"
-            
-            # Verify it's the only README in the root
-            readme_files = list(project_dir.glob("README.*"))
-            assert len(readme_files) == 1, "Should be exactly one README file"
-            assert readme_files[0] == readme_path, "The README file should be README.md"
-            
-        finally:
-            # Cleanup
-            if os.path.exists(project_path):
-                shutil.rmtree(project_path, ignore_errors=True)
+        project_dir = _new_project_dir(work_dir)
+        readme_path = project_dir / "README.md"
+        
+        # Write the README
+        readme_path.write_bytes(content.encode('utf-8'))
+        
+        # Verify the filename
+        assert readme_path.name == "README.md", "Filename should be exactly 'README.md'"
+        assert readme_path.suffix == ".md", "File extension should be .md"
+        
+        # Verify it's the only README in the root
+        readme_files = [e.name for e in os.scandir(project_dir) if e.name.startswith("README.")]
+        assert readme_files == ["README.md"], "Should be exactly one README file, named README.md"
@@ -131,7 +131,6 @@ class TestValidInputAcceptance:
     """Test that valid inputs are accepted"""
     
     @given(path=valid_local_paths())
-    @settings(max_examples=100)
     def test_valid_local_paths_are_accepted(self, path):
         """For any valid local path, the validator should accept it"""
         validator = InputValidator()
@@ -146,7 +145,6 @@ class TestValidInputAcceptance:
         assert result.sanitized_input is not None, "Valid path should have sanitized input"
     
     @given(url=valid_github_urls())
-    @settings(max_examples=100)
     def test_valid_github_urls_are_accepted(self, url):
         """For any valid GitHub URL, the validator should accept it"""
         validator = InputValidator()
@@ -165,7 +163,6 @@ class TestInvalidInputRejection:
     """Test that invalid inputs are rejected"""
     
     @given(path=invalid_local_paths())
-    @settings(max_examples=100)
     def test_invalid_local_paths_are_rejected(self, path):
         """For any invalid local path, the validator should reject it"""
         validator = InputValidator()
@@ -182,7 +179,6 @@ class TestInvalidInputRejection:
         assert result.error_message is not None, "Invalid path should have error message"
     
     @given(url=invalid_github_urls())
-    @settings(max_examples=100)
     def test_invalid_github_urls_are_rejected(self, url):
         """For any invalid GitHub URL, the validator should reject it"""
         validator = InputValidator()
@@ -192,7 +188,8 @@ class TestInvalidInputRejection:
         assert result.error_message is not None, "Invalid URL should have error message"
     
     @given(input_val=st.one_of(st.none(), st.integers(), st.lists(st.text())))
-    @settings(max_examples=50)
+    # Small input space: half the active profile's budget is plenty
+    @settings(max_examples=max(1, settings().max_examples // 2))
     def test_non_string_inputs_are_rejected(self, input_val):
         """For any non-string input, the validator should reject it"""
         validator = InputValidator()
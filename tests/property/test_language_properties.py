@@ -241,7 +241,7 @@ class TestLanguageDetectionFromConfigFiles:
     """Test that language detector identifies languages from config files"""
     
     @given(project=python_project_structure())
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     def test_detects_python_from_config_files(self, project):
         """For any project with Python config files, detector should identify Python"""
         temp_dir, structure, config_files = project
@@ -267,7 +267,7 @@ class TestLanguageDetectionFromConfigFiles:
                 shutil.rmtree(temp_dir, ignore_errors=True)
     
     @given(project=nodejs_project_structure())
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     def test_detects_nodejs_from_package_json(self, project):
         """For any project with package.json, detector should identify Node.js"""
         temp_dir, structure, config_files = project
@@ -292,7 +292,7 @@ class TestLanguageDetectionFromConfigFiles:
                 shutil.rmtree(temp_dir, ignore_errors=True)
     
     @given(project=rust_project_structure())
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     def test_detects_rust_from_cargo_toml(self, project):
         """For any project with Cargo.toml, detector should identify Rust"""
         temp_dir, structure, config_files = project
@@ -321,7 +321,7 @@ class TestLanguageDetectionFromConfigFiles:
         has_setup_py=st.booleans(),
         has_pyproject=st.booleans()
     )
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     def test_python_detection_with_various_config_combinations(
         self, has_requirements, has_setup_py, has_pyproject
     ):
@@ -396,7 +396,7 @@ class TestMultiLanguageDetection:
     """Test that language detector identifies all languages and determines primary"""
     
     @given(project=multi_language_project_structure())
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     def test_detects_all_present_languages(self, project):
         """For any project with multiple languages, detector should identify all"""
         temp_dir, structure, expected_languages = project
@@ -423,7 +423,7 @@ class TestMultiLanguageDetection:
                 shutil.rmtree(temp_dir, ignore_errors=True)
     
     @given(project=multi_language_project_structure())
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     def test_determines_primary_language(self, project):
         """For any multi-language project, detector should determine a primary language"""
         temp_dir, structure, expected_languages = project
@@ -456,7 +456,7 @@ class TestMultiLanguageDetection:
         num_py_files=st.integers(min_value=1, max_value=20),
         num_js_files=st.integers(min_value=1, max_value=20)
     )
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     def test_primary_language_based_on_file_count(self, num_py_files, num_js_files):
         """For any project, primary language should be determined by file count"""
         temp_dir = tempfile.mkdtemp()
@@ -517,7 +517,7 @@ class TestMultiLanguageDetection:
                 shutil.rmtree(temp_dir, ignore_errors=True)
     
     @given(num_files=st.integers(min_value=1, max_value=50))
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     def test_confidence_scores_sum_to_one(self, num_files):
         """For any project, confidence scores should sum to approximately 1.0"""
         temp_dir = tempfile.mkdtemp()
@@ -566,7 +566,7 @@ class TestMultiLanguageDetection:
                 shutil.rmtree(temp_dir, ignore_errors=True)
     
     @given(structure=multi_language_project_structure())
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     def test_each_language_has_indicators(self, structure):
         """For any detected language, it should have indicator files listed"""
         temp_dir, project_structure, expected_languages = structure
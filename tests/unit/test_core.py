@@ -0,0 +1,40 @@
+"""
+Unit tests for the DeepScanner source patterns in core.py
+"""
+from core import _JAVA_CODE_RE, _PY_CODE_RE, DeepScanner
+
+
+def _groups(pattern, content):
+    return [(m.lastgroup, m.group(m.lastgroup)) for m in pattern.finditer(content)]
+
+
+def test_python_class_at_line_end_does_not_swallow_next_import():
+    """A comment ending in "class" must not turn the next import into a class name"""
+    content = "# used by the handler class\nimport redis\n"
+    assert _groups(_PY_CODE_RE, content) == [('imp', 'redis')]
+
+
+def test_java_class_at_line_end_does_not_swallow_next_import():
+    """Same as above for Java sources"""
+    content = "// class\nimport org.example.Thing;\n"
+    assert _groups(_JAVA_CODE_RE, content) == [('imp', 'org.example.Thing')]
+
+
+def test_python_class_and_import_on_separate_lines():
+    """Both branches still match normal declarations"""
+    content = "import redis\nfrom flask import Flask\n\nclass Cache:\n    pass\n"
+    assert _groups(_PY_CODE_RE, content) == [
+        ('imp', 'redis'), ('imp', 'flask'), ('cls', 'Cache'),
+    ]
+
+
+def test_import_after_line_ending_class_is_detected(tmp_path):
+    """The redis import is kept as a dependency and still yields the cache service"""
+    (tmp_path / "cache.py").write_text("# used by the handler class\nimport redis\n")
+
+    scanner = DeepScanner(str(tmp_path))
+    scanner.setup_path()
+    scanner.scan()
+
+    assert "redis" in scanner.metadata["dependencies"]["Python"]
+    assert "Cache: Redis" in scanner.metadata["tech_stack"]